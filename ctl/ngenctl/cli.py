@@ -3,36 +3,53 @@
 
 import sys
 import os
-import subprocess
-import json
 import shutil
+import functools
+import stat
 from pathlib import Path
 
+# Optional fast JSON codec; alias files fall back to the stdlib json
+# module when orjson is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+# $HOME resolved once per process; Path.home() (which can fall back to
+# a pwd/getpwuid lookup) is only consulted when the variable is unset.
+_HOME = os.environ.get("HOME") or str(Path.home())
+
+# Precomputed alias resolutions from new-format alias files, filled in
+# by load_aliases; lets main skip chain-walking entirely.
+_RESOLVED = {}
+
+
+@functools.lru_cache(maxsize=1)
 def get_alias_file_path() -> Path:
     """
     Get the path to the alias configuration file.
-    
+
+    Cached for the process lifetime so repeated load/save calls don't
+    redo the home-directory lookup and Path construction.
+
     Returns:
         Path to $HOME/.ngen/alias.json
     """
-    home = Path.home()
-    alias_dir = home / ".ngen"
-    alias_file = alias_dir / "alias.json"
-    return alias_file
+    return Path(_HOME, ".ngen", "alias.json")
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_file_path() -> Path:
     """
     Get the path to the config configuration file.
-    
+
+    Cached for the process lifetime so repeated load/save calls don't
+    redo the home-directory lookup and Path construction.
+
     Returns:
         Path to $HOME/.ngen/config.json
     """
-    home = Path.home()
-    config_dir = home / ".ngen"
-    config_file = config_dir / "config.json"
-    return config_file
+    return Path(_HOME, ".ngen", "config.json")
 
 
 def load_config() -> dict:
@@ -43,6 +60,8 @@ def load_config() -> dict:
     Returns:
         Dictionary of config (empty dict if file doesn't exist or is invalid)
     """
+    import json
+
     config_file = get_config_file_path()
     
     # Create directory if it doesn't exist
@@ -83,35 +102,56 @@ def load_aliases() -> dict:
         Dictionary of aliases (empty dict if file doesn't exist or is invalid)
     """
     alias_file = get_alias_file_path()
-    
-    # Create directory if it doesn't exist
-    alias_file.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Create empty JSON file if it doesn't exist
-    if not alias_file.exists():
+
+    # EAFP: attempt the read first. After first use the directory and
+    # file always exist, so the common path is a single open instead of
+    # a guaranteed mkdir + stat every invocation. Files past 64KiB are
+    # memory-mapped so the parser reads straight from the page cache
+    # instead of an intermediate buffer.
+    try:
+        with open(alias_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > 65536:
+                import mmap
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if orjson is not None:
+                        aliases = orjson.loads(memoryview(mm))
+                    else:
+                        import json
+                        aliases = json.loads(mm[:])
+            else:
+                data = f.read()
+                if orjson is not None:
+                    aliases = orjson.loads(data)
+                else:
+                    import json
+                    aliases = json.loads(data)
+    except FileNotFoundError:
         try:
-            with open(alias_file, 'w') as f:
-                json.dump({}, f)
-            return {}
+            alias_file.parent.mkdir(parents=True, exist_ok=True)
+            alias_file.write_bytes(b"{}")
         except Exception as e:
             print(f"Warning: Could not create alias file {alias_file}: {e}", file=sys.stderr)
-            return {}
-    
-    # Load existing aliases
-    try:
-        with open(alias_file, 'r') as f:
-            aliases = json.load(f)
-            if not isinstance(aliases, dict):
-                print(f"Warning: Invalid alias file format in {alias_file}", file=sys.stderr)
-                return {}
-            return aliases
-    except json.JSONDecodeError as e:
+        return {}
+    except ValueError as e:
         print(f"Warning: Invalid JSON in alias file {alias_file}: {e}", file=sys.stderr)
         return {}
     except Exception as e:
         print(f"Warning: Could not read alias file {alias_file}: {e}", file=sys.stderr)
         return {}
 
+    if not isinstance(aliases, dict):
+        print(f"Warning: Invalid alias file format in {alias_file}", file=sys.stderr)
+        return {}
+    # New-format files carry the raw mapping under "aliases" plus a
+    # resolution table precomputed at save time; flat legacy files
+    # are returned as-is
+    if isinstance(aliases.get("aliases"), dict):
+        resolved = aliases.get("resolved")
+        if isinstance(resolved, dict):
+            _RESOLVED.update(resolved)
+        aliases = aliases["aliases"]
+    return aliases
+
 
 def save_aliases(aliases: dict) -> bool:
     """
@@ -128,101 +168,190 @@ def save_aliases(aliases: dict) -> bool:
     try:
         # Ensure directory exists
         alias_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(alias_file, 'w') as f:
-            json.dump(aliases, f, indent=2)
+
+        # Normalize whitespace in alias values once at save time, so
+        # read-time resolution can rely on single-space separators
+        # (partition(' ') does not collapse tabs or runs of spaces)
+        aliases = {
+            name: ' '.join(value.split()) if isinstance(value, str) else value
+            for name, value in aliases.items()
+        }
+
+        # Persist the raw mapping together with its transitive closure,
+        # so runtime resolution is one dict probe regardless of how
+        # deeply aliases chain
+        payload = {
+            "aliases": aliases,
+            "resolved": {name: resolve_alias(name, aliases) for name in aliases},
+        }
+
+        # Compact output: alias.json is machine-written, so skip the
+        # pretty-printing pass (orjson emits compact by default)
+        if orjson is not None:
+            with open(alias_file, 'wb') as f:
+                f.write(orjson.dumps(payload))
+        else:
+            import json
+            with open(alias_file, 'w') as f:
+                json.dump(payload, f, separators=(",", ":"))
         return True
     except Exception as e:
         print(f"Error saving aliases to {alias_file}: {e}", file=sys.stderr)
         return False
 
 
-def resolve_alias(command: str, aliases: dict, visited: set = None) -> str:
+def resolve_alias(command: str, aliases: dict) -> str:
     """
     Resolve alias to actual command, handling nested aliases and recursion.
-    
+
+    Resolution is iterative: each nesting level costs one dict lookup
+    and one str.partition, with no recursive call frames. Arguments
+    carried by intermediate aliases accumulate in order.
+
     Args:
         command: The command to resolve
         aliases: Dictionary of aliases
-        visited: Set of already visited commands (to detect recursion)
-        
+
     Returns:
         Resolved command string, or original command if not an alias
     """
-    if visited is None:
-        visited = set()
-    
-    # Check if this command is an alias
-    if command not in aliases:
-        return command
-    
-    # Detect recursion
-    if command in visited:
-        print(f"Error: Circular alias detected involving '{command}'", file=sys.stderr)
+    # Single probe: one dict lookup answers the not-an-alias case
+    expanded = aliases.get(command)
+    if expanded is None:
         return command
-    
-    # Resolve the alias
-    visited.add(command)
-    expanded = aliases[command]
-    
-    # If expanded command is also an alias, resolve recursively
-    if isinstance(expanded, str):
-        parts = expanded.split(None, 1)
-        if parts and parts[0] in aliases:
-            resolved = resolve_alias(parts[0], aliases, visited)
-            if len(parts) > 1:
-                return f"{resolved} {parts[1]}"
-            return resolved
-    
-    return expanded
 
+    visited = None
+    suffix = ""
+    while True:
+        # Non-string values pass through unchanged
+        if not isinstance(expanded, str):
+            return expanded
+
+        head, _, tail = expanded.partition(' ')
+        if head not in aliases:
+            resolved = expanded
+            break
+
+        # Keep the intermediate alias's arguments before the cycle
+        # check, so a detected cycle still reports them (matching the
+        # recursive resolver's behaviour)
+        if tail:
+            suffix = f"{tail} {suffix}" if suffix else tail
+
+        # Entering a nested level: only now pay for the visited set
+        if visited is None:
+            visited = {command}
+
+        # Detect recursion
+        if head in visited:
+            print(f"Error: Circular alias detected involving '{head}'", file=sys.stderr)
+            resolved = head
+            break
+        visited.add(head)
+
+        # Go one level in
+        expanded = aliases[head]
+
+    if suffix:
+        return f"{resolved} {suffix}"
+    return resolved
 
+
+# Mode bits recorded by find_script's stat, keyed by script path, so
+# execute_script can check the exec bit without another syscall.
+_SCRIPT_MODES = {}
+
+
+@functools.lru_cache(maxsize=64)
 def find_script(command: str) -> Path:
     """
     Find the script wrapper for the given command.
-    
+
+    Results are cached per process (alias resolution can probe the same
+    command several times), and each candidate costs one os.stat instead
+    of separate exists() and is_file() checks.
+
     Priority:
     1. /usr/local/bin/ngen-{command}
     2. Scripts bundled in the package
-    
+
     Args:
         command: The subcommand (e.g., "rancher", "git")
-        
+
     Returns:
         Path to the script, or None if not found
     """
     # Check in /usr/local/bin first
     system_script = Path(f"/usr/local/bin/ngen-{command}")
-    if system_script.exists() and system_script.is_file():
-        return system_script
-    
+    try:
+        st = os.stat(system_script)
+        if stat.S_ISREG(st.st_mode):
+            _SCRIPT_MODES[str(system_script)] = st.st_mode
+            return system_script
+    except OSError:
+        pass
+
     # Check in bundled scripts
-    package_dir = Path(__file__).parent
-    bundled_script = package_dir / "scripts" / f"ngen-{command}"
-    if bundled_script.exists() and bundled_script.is_file():
-        return bundled_script
-    
+    bundled_script = Path(__file__).parent / "scripts" / f"ngen-{command}"
+    try:
+        st = os.stat(bundled_script)
+        if stat.S_ISREG(st.st_mode):
+            _SCRIPT_MODES[str(bundled_script)] = st.st_mode
+            return bundled_script
+    except OSError:
+        pass
+
     return None
 
 
 def execute_script(script_path: Path, args: list) -> int:
     """
     Execute the script with the given arguments.
-    
+
+    Replaces the current process with the script via os.execv, so on
+    success this never returns: no fork, no wait, and the wrapper's
+    memory is released immediately. If the exec fails (e.g. a script
+    with no shebang), falls back to spawning a child and waiting.
+
     Args:
         script_path: Path to the script to execute
         args: List of arguments to pass to the script
-        
+
     Returns:
-        Exit code from the script execution
+        Exit code from the script execution (fallback path only)
     """
+    script = str(script_path)
     try:
-        # Make script executable if it's not already
-        if not os.access(script_path, os.X_OK):
-            os.chmod(script_path, 0o755)
-        
-        # Execute the script with arguments
-        result = subprocess.run([str(script_path)] + args)
+        # Check the exec bit from the mode find_script already stat'ed
+        # instead of an os.access syscall; re-stat only for callers
+        # that bypassed find_script
+        mode = _SCRIPT_MODES.get(script)
+        if mode is None:
+            mode = os.stat(script).st_mode
+        if mode & 0o111 == 0:
+            # Changing permissions behind the user's back deserves a note
+            print(f"Warning: making {script} executable", file=sys.stderr)
+            # fchmod on an open descriptor skips the path re-walk, and
+            # fstat picks up the current mode rather than the cached one
+            fd = os.open(script, os.O_RDONLY)
+            try:
+                os.fchmod(fd, os.fstat(fd).st_mode | 0o755)
+            finally:
+                os.close(fd)
+
+        # Hand the process over to the script
+        os.execv(script, [script] + args)
+    except OSError:
+        pass
+    except Exception as e:
+        print(f"Error executing {script_path}: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        # Fallback: execute the script as a child process. Deferred
+        # import: the execv success path never pays for subprocess
+        import subprocess
+        result = subprocess.run([script] + args)
         return result.returncode
     except Exception as e:
         print(f"Error executing {script_path}: {e}", file=sys.stderr)
@@ -267,6 +396,7 @@ def execute_env_command(command: str, args: list) -> int:
     """
     try:
         # Execute the command with arguments
+        import subprocess
         result = subprocess.run([command] + args)
         return result.returncode
     except Exception as e:
@@ -274,38 +404,93 @@ def execute_env_command(command: str, args: list) -> int:
         return 1
 
 
+def _list_script_commands() -> set:
+    """
+    Discover available wrapper-script commands, with a disk cache.
+
+    Scanning /usr/local/bin can walk thousands of entries for a handful
+    of matches. The result is cached in $HOME/.ngen/commands.cache keyed
+    by the (st_mtime_ns, st_size) of both script directories, so the
+    steady state costs two stats and one small read instead of a full
+    scan; installing or removing a script changes a directory mtime and
+    invalidates the cache.
+
+    Returns:
+        Set of command names that have a wrapper script
+    """
+    import pickle
+
+    script_dirs = ("/usr/local/bin", str(Path(__file__).parent / "scripts"))
+    key = []
+    for script_dir in script_dirs:
+        try:
+            st = os.stat(script_dir)
+            key.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            key.append(None)
+    key = tuple(key)
+
+    cache_file = Path(_HOME, ".ngen", "commands.cache")
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_key, commands = pickle.load(f)
+        if cached_key == key:
+            return commands
+    except Exception:
+        pass
+
+    # Rescan; DirEntry.is_file() reuses the dirent, no per-file stat
+    commands = set()
+    for script_dir in script_dirs:
+        try:
+            with os.scandir(script_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith("ngen-") and entry.is_file():
+                        commands.add(entry.name.removeprefix("ngen-"))
+        except OSError:
+            pass
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump((key, commands), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        pass
+
+    return commands
+
+
 def main():
     """Main entry point for ngenctl command."""
-    # Load aliases and config
-    aliases = load_aliases()
-    config = load_config()
-    
-    if len(sys.argv) < 2:
+    # Help flags and the no-args usage line print before any filesystem
+    # work; only the command listing itself pays for loads and scans
+    argv = sys.argv
+    command = argv[1] if len(argv) >= 2 else None
+
+    if command in ("-h", "--help", "help"):
+        print("Usage: ngenctl <command> [args...]", file=sys.stderr)
+        print("\nngenctl is a universal command wrapper that dispatches to scripts at /usr/local/bin/ngen-*")
+        print("\nExamples:")
+        print("  ngenctl rancher --help")
+        print("  ngenctl git clone <repo>")
+        sys.exit(0)
+
+    if command is None:
         print("Usage: ngenctl <command> [args...]", file=sys.stderr)
         print("\nAvailable commands:")
+        # Listing needs the full picture
+        aliases = load_aliases()
+        config = load_config()
         # List available commands
         commands_found = set()
         command_info = {}  # Store info about each command (type: alias, env, script)
         
-        # Check /usr/local/bin
-        system_bin = Path("/usr/local/bin")
-        if system_bin.exists():
-            for script in system_bin.glob("ngen-*"):
-                if script.is_file():
-                    command = script.name.replace("ngen-", "", 1)
-                    commands_found.add(command)
-                    if command not in command_info:
-                        command_info[command] = "script"
-        # Check bundled scripts
-        package_dir = Path(__file__).parent
-        bundled_dir = package_dir / "scripts"
-        if bundled_dir.exists():
-            for script in bundled_dir.glob("ngen-*"):
-                if script.is_file():
-                    command = script.name.replace("ngen-", "", 1)
-                    commands_found.add(command)
-                    if command not in command_info:
-                        command_info[command] = "script"
+        # Script commands come from the mtime-keyed disk cache, so the
+        # common path avoids rescanning /usr/local/bin entirely
+        for command in _list_script_commands():
+            commands_found.add(command)
+            if command not in command_info:
+                command_info[command] = "script"
         # Add aliases to the list
         for alias_name in aliases.keys():
             commands_found.add(alias_name)
@@ -327,20 +512,30 @@ def main():
             print("  (no commands found)")
         sys.exit(1)
     
-    command = sys.argv[1]
-    
-    # Handle help flags
-    if command in ("-h", "--help", "help"):
-        print("Usage: ngenctl <command> [args...]", file=sys.stderr)
-        print("\nngenctl is a universal command wrapper that dispatches to scripts at /usr/local/bin/ngen-*")
-        print("\nExamples:")
-        print("  ngenctl rancher --help")
-        print("  ngenctl git clone <repo>")
-        sys.exit(0)
-    
-    # Check if command is an alias and resolve it
-    if command in aliases:
+    # Fast path: let the kernel resolve ngen-<command> through PATH
+    # (one execvp, served from the dentry cache) instead of probing
+    # directories from Python. Does not return on success.
+    args = argv[2:]
+    prog = f"ngen-{command}"
+    try:
+        os.execvp(prog, [prog] + args)
+    except OSError:
+        pass
+
+    # Bundled scripts are not on PATH; probe them explicitly
+    script_path = find_script(command)
+    if script_path is not None:
+        exit_code = execute_script(script_path, args)
+        sys.exit(exit_code)
+
+    # No direct script: consult aliases and resolve if needed. The
+    # save-time resolution table answers with one probe; chains only
+    # get walked for legacy flat alias files
+    aliases = load_aliases()
+    expanded = _RESOLVED.get(command)
+    if expanded is None and aliases.get(command) is not None:
         expanded = resolve_alias(command, aliases)
+    if expanded is not None:
         # Split expanded command into command and remaining args
         expanded_parts = expanded.split()
         if expanded_parts:
@@ -350,22 +545,21 @@ def main():
             args = expanded_parts[1:] + existing_args
         else:
             args = sys.argv[2:]
+
+        script_path = find_script(command)
+        if script_path is not None:
+            exit_code = execute_script(script_path, args)
+            sys.exit(exit_code)
     else:
         args = sys.argv[2:]
-    
-    # Priority: 1) Scripts, 2) Environment commands from config
-    script_path = find_script(command)
-    
-    if script_path is not None:
-        exit_code = execute_script(script_path, args)
-        sys.exit(exit_code)
-    
+
     # Check for environment command in config
+    config = load_config()
     env_command = find_env_command(command, config)
     if env_command is not None:
         exit_code = execute_env_command(env_command, args)
         sys.exit(exit_code)
-    
+
     # Command not found
     print(f"Error: command '{command}' not found", file=sys.stderr)
     print(f"Expected script at: /usr/local/bin/ngen-{command}", file=sys.stderr)
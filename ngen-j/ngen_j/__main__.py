@@ -0,0 +1,14 @@
+"""Entry point for `python -m ngen_j`."""
+
+import sys
+
+# Version probes are the most common CI invocation: answer them before
+# cli.py (and anything it drags in) is even parsed.
+if len(sys.argv) >= 2 and sys.argv[1] in ("--version", "-V"):
+    from . import __version__
+    print(f"ngen-j version {__version__}")
+    sys.exit(0)
+
+from .cli import main
+
+main()
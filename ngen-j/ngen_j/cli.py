@@ -3,13 +3,111 @@
 
 import sys
 import os
-import subprocess
+import functools
+import contextlib
 from pathlib import Path
-from . import __version__
-from .jenkins import JenkinsClient, save_env_file, load_env_file, get_env_file_path
 
+# Full usage text, emitted with a single write on the help and no-args
+# paths instead of a print ladder.
+_USAGE = """Usage: ngen-j <command> [args...]
+
+ngen-j is a Jenkins API management CLI tool.
+
+Built-in commands:
+  login             Save Jenkins credentials
+  check             Validate Jenkins access
+  jobs              List all Jenkins jobs
+  job <name>        Get job details
+  job --last-success Get last 10 successful jobs
+  job --last-failure Get last 10 failed jobs
+  build <job-name>  Trigger a build
+  log <name> <num>  Get build console output
+  get-xml <name>    Get job configuration XML
+  create <name> <xml> Create/update job from XML
+  delete <name>     Delete a job
+  plugin list       List installed plugins
+  plugin install   Install plugin(s)
+  plugin uninstall Uninstall plugin(s)
+                    Use --format json|csv and --output <file> for export
+  cred list         List all credentials
+  cred create       Create credential (interactive or non-interactive)
+  cred delete <id>  Delete credential
+
+Script commands:
+  <script-name>     Execute bundled script
+
+Examples:
+  ngen-j --version
+  ngen-j jobs
+  ngen-j job my-job
+  ngen-j job --last-success
+  ngen-j job --last-failure
+  ngen-j build my-job
+  ngen-j build my-job --param REF_NAME=develop
+  ngen-j build my-job --param=REF_NAME=develop
+  ngen-j log my-job 42
+  ngen-j get-xml my-job
+  ngen-j create my-job job.xml
+  ngen-j delete my-job
+  ngen-j delete my-job --force
+  ngen-j plugin list
+  ngen-j plugin list --format json --output plugins.json
+  ngen-j plugin list --format csv --output plugins.csv
+  ngen-j plugin install git
+  ngen-j plugin uninstall git
+  ngen-j cred list
+  ngen-j cred create
+  ngen-j cred delete my-cred
+"""
+
+
+# ANSI colors for build statuses, resolved with one dict lookup per row
+# instead of an if/elif chain. Colors are skipped entirely when stdout
+# is not a terminal (pipes, redirects); checked once at import.
+_RESET = '\033[0m'
+_STATUS_COLOR = {
+    'SUCCESS': '\033[92m',   # Green
+    'FAILURE': '\033[91m',   # Red
+    'BUILDING': '\033[93m',  # Yellow
+}
+_COLOR_ENABLED = sys.stdout.isatty()
+
+
+def _colorize(status: str) -> str:
+    """Wrap a build status in its ANSI color when stdout is a TTY."""
+    color = _STATUS_COLOR.get(status) if _COLOR_ENABLED else None
+    return f"{color}{status}{_RESET}" if color else status
+
+
+@functools.lru_cache(maxsize=1)
+def _script_index() -> dict:
+    """
+    Build an index of bundled scripts with a single directory scan.
 
-def find_script(command: str) -> Path:
+    Returns:
+        Dictionary mapping command name to (path, st_mode) tuple
+    """
+    scripts_dir = Path(__file__).parent / "scripts"
+    index = {}
+    try:
+        with os.scandir(scripts_dir) as entries:
+            for entry in entries:
+                # DirEntry.is_file()/stat() reuse the scandir stat
+                # buffer, avoiding a second stat per script. entry.path
+                # is already a string, so dispatch never pays a str()
+                # call. The mode bits let execute-time code check the
+                # exec bit without an os.access syscall.
+                if entry.name.startswith("ngen-j-") and entry.is_file():
+                    index[entry.name.removeprefix("ngen-j-")] = (
+                        entry.path,
+                        entry.stat().st_mode,
+                    )
+    except FileNotFoundError:
+        pass
+    return index
+
+
+def find_script(command: str) -> str:
     """
     Find the script wrapper for the given command.
 
@@ -17,41 +115,183 @@ def find_script(command: str) -> Path:
         command: The subcommand (e.g., "rancher", "git")
 
     Returns:
-        Path to the script, or None if not found
+        Path to the script as a string, or None if not found
     """
     # Check in bundled scripts only
-    package_dir = Path(__file__).parent
-    bundled_script = package_dir / "scripts" / f"ngen-j-{command}"
-    if bundled_script.exists() and bundled_script.is_file():
-        return bundled_script
-
-    return None
+    entry = _script_index().get(command)
+    return entry[0] if entry is not None else None
 
 
-def execute_script(script_path: Path, args: list) -> int:
+def execute_script(script_path: str, args: list) -> int:
     """
     Execute the script with the given arguments.
-    
+
+    On POSIX this replaces the current process with the script via
+    os.execv and does not return on success: no fork, no wait, and the
+    interpreter's memory is released immediately. Elsewhere (or if the
+    exec fails) it falls back to spawning a child and waiting.
+
     Args:
         script_path: Path to the script to execute
         args: List of arguments to pass to the script
-        
+
     Returns:
-        Exit code from the script execution
+        Exit code from the script execution (fallback path only)
     """
+    if os.name == "posix":
+        try:
+            # Callers guarantee the exec bit (set at install time, or
+            # fixed up from the cached scan mode), so no access check
+            os.execv(script_path, [script_path] + args)
+        except OSError:
+            # Fall through to the subprocess fallback, which copes with
+            # cases execv cannot (e.g. ENOEXEC scripts without a shebang)
+            pass
     try:
-        # Make script executable if it's not already
-        if not os.access(script_path, os.X_OK):
-            os.chmod(script_path, 0o755)
-        
-        # Execute the script with arguments
-        result = subprocess.run([str(script_path)] + args)
+        # Deferred: only the non-POSIX fallback pays for the subprocess
+        # import (and the selectors/signal modules it drags in)
+        import subprocess
+
+        result = subprocess.run((script_path, *args))
         return result.returncode
     except Exception as e:
         print(f"Error executing {script_path}: {e}", file=sys.stderr)
         return 1
 
 
+@functools.lru_cache(maxsize=1)
+def _client():
+    """
+    Return the process-wide JenkinsClient, constructed lazily on first use.
+
+    Commands can hit the Jenkins API several times in one invocation; a
+    single cached client reuses its HTTP connection pool and parsed
+    credentials instead of re-handshaking per call.
+    """
+    from .jenkins import JenkinsClient
+    return JenkinsClient()
+
+
+@contextlib.contextmanager
+def _patched_env(patch: dict):
+    """
+    Temporarily apply the given environment variables.
+
+    Snapshots only the touched keys, applies the patch with one bulk
+    update and restores in a finally block, so keys that were absent are
+    removed again even if the body raises.
+
+    Args:
+        patch: Environment variables to apply inside the block
+    """
+    saved = {key: os.environ.get(key) for key in patch}
+    os.environ.update(patch)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is not None:
+                os.environ[key] = value
+            else:
+                os.environ.pop(key, None)
+
+
+def _test_connection(env_vars: dict) -> None:
+    """
+    Test Jenkins connectivity using the given credentials.
+
+    Args:
+        env_vars: Environment variables to apply while testing
+    """
+    from .jenkins import JenkinsClient
+
+    print("\nTesting connection...")
+    try:
+        with _patched_env(env_vars):
+            client = JenkinsClient()
+            version = client.client.version
+        print(f"✅ Connection successful! Jenkins version: {version}")
+    except Exception as e:
+        print(f"❌ Connection test failed: {e}")
+        print("Please check your credentials and try again.")
+
+
+def _parse_flags(args: list, value_flags: tuple, bool_flags: tuple = ()):
+    """
+    One-pass parser for --flag VALUE / bare --flag argument lists.
+
+    Shared by the commands that take keyword-style flags, instead of
+    each branch re-scanning its argument list with index arithmetic.
+
+    Args:
+        args: Raw argument list
+        value_flags: Flags that consume the following argument
+        bool_flags: Flags that stand alone
+
+    Returns:
+        Tuple of (opts, leftover): opts maps flag names without the
+        leading dashes to their values (True for bool flags); leftover
+        collects everything unrecognized, in order
+    """
+    opts = {}
+    leftover = []
+    i = 0
+    n = len(args)
+    while i < n:
+        arg = args[i]
+        if arg in value_flags and i + 1 < n:
+            opts[arg.lstrip('-')] = args[i + 1]
+            i += 2
+        elif arg in bool_flags:
+            opts[arg.lstrip('-')] = True
+            i += 1
+        else:
+            leftover.append(arg)
+            i += 1
+    return opts, leftover
+
+
+def _parse_login_flags(args: list):
+    """
+    Build login env vars from command-line flags, if enough were given.
+
+    Supports --url, --user, --token, --password, --auth and --method so
+    scripted/CI callers can log in without touching a single prompt.
+
+    Args:
+        args: List of arguments for login command
+
+    Returns:
+        Dictionary of env vars ready for save_env_file, or None when the
+        interactive prompts are still needed
+    """
+    opts, _ = _parse_flags(
+        args, ("--url", "--user", "--token", "--password", "--auth", "--method")
+    )
+
+    url = opts.get("url")
+    if not url:
+        return None
+
+    if not url.startswith(("http://", "https://")):
+        print("Error: Jenkins URL must start with http:// or https://", file=sys.stderr)
+        sys.exit(1)
+
+    method = opts.get("method")
+    if method in (None, "1") and opts.get("user") and opts.get("token"):
+        return {"JENKINS_URL": url, "JENKINS_USER": opts["user"], "JENKINS_TOKEN": opts["token"]}
+    if method in (None, "2") and opts.get("user") and opts.get("password"):
+        # binascii avoids pulling in the base64 module on the login path
+        import binascii
+        auth_b64 = binascii.b2a_base64(
+            f"{opts['user']}:{opts['password']}".encode('utf-8'), newline=False
+        ).decode('ascii')
+        return {"JENKINS_URL": url, "JENKINS_AUTH": auth_b64}
+    if method in (None, "3") and opts.get("auth"):
+        return {"JENKINS_URL": url, "JENKINS_AUTH": opts["auth"]}
+    return None
+
+
 def handle_login_command(args: list) -> int:
     """
     Handle login command to save Jenkins credentials.
@@ -64,135 +304,131 @@ def handle_login_command(args: list) -> int:
     """
     import getpass
 
-    print("ngen-j Jenkins Login")
-    print("===================")
+    from .jenkins import save_env_file, load_env_file, get_env_file_path, clear_env_cache
 
-    # Get current env vars
-    current_env = load_env_file()
+    # The connection test costs a full HTTP round trip; only pay for it
+    # when explicitly requested
+    test_connection = '--test' in args
 
-    # Prompt for Jenkins URL
-    current_url = current_env.get("JENKINS_URL", "")
-    if current_url:
-        url = input(f"Jenkins URL [{current_url}]: ").strip() or current_url
-    else:
-        url = input("Jenkins URL: ").strip()
+    # Non-interactive path: all credentials supplied via flags, so
+    # skip every prompt (and its TTY round trips) entirely
+    env_vars = _parse_login_flags(args)
 
-    if not url:
-        print("Error: Jenkins URL is required", file=sys.stderr)
-        return 1
+    if env_vars is None:
+        print("ngen-j Jenkins Login")
+        print("===================")
 
-    # Validate URL format
-    if not url.startswith(('http://', 'https://')):
-        print("Error: Jenkins URL must start with http:// or https://", file=sys.stderr)
-        return 1
+        # Get current env vars
+        current_env = load_env_file()
 
-    # Choose authentication method
-    print("\nAuthentication method:")
-    print("1. Username + API Token (recommended)")
-    print("2. Username + Password")
-    print("3. Base64 encoded credentials")
-
-    while True:
-        choice = input("Choose method [1]: ").strip() or "1"
-        if choice in ["1", "2", "3"]:
-            break
-        print("Invalid choice. Please enter 1, 2, or 3.")
-
-    env_vars = {"JENKINS_URL": url}
-
-    if choice == "1":
-        # Username + API Token
-        current_user = current_env.get("JENKINS_USER", "")
-        if current_user:
-            user = input(f"Username [{current_user}]: ").strip() or current_user
+        # Prompt for Jenkins URL
+        current_url = current_env.get("JENKINS_URL", "")
+        if current_url:
+            url = input(f"Jenkins URL [{current_url}]: ").strip() or current_url
         else:
-            user = input("Username: ").strip()
+            url = input("Jenkins URL: ").strip()
 
-        if not user:
-            print("Error: Username is required", file=sys.stderr)
+        if not url:
+            print("Error: Jenkins URL is required", file=sys.stderr)
             return 1
 
-        current_token = current_env.get("JENKINS_TOKEN", "")
-        if current_token:
-            token = getpass.getpass(f"API Token [current token set]: ").strip() or current_token
-        else:
-            token = getpass.getpass("API Token: ").strip()
-
-        if not token:
-            print("Error: API Token is required", file=sys.stderr)
+        # Validate URL format
+        if not url.startswith(('http://', 'https://')):
+            print("Error: Jenkins URL must start with http:// or https://", file=sys.stderr)
             return 1
 
-        env_vars["JENKINS_USER"] = user
-        env_vars["JENKINS_TOKEN"] = token
+        # Choose authentication method
+        print("\nAuthentication method:")
+        print("1. Username + API Token (recommended)")
+        print("2. Username + Password")
+        print("3. Base64 encoded credentials")
+
+        while True:
+            choice = input("Choose method [1]: ").strip() or "1"
+            if choice in ["1", "2", "3"]:
+                break
+            print("Invalid choice. Please enter 1, 2, or 3.")
+
+        env_vars = {"JENKINS_URL": url}
+
+        if choice == "1":
+            # Username + API Token
+            current_user = current_env.get("JENKINS_USER", "")
+            if current_user:
+                user = input(f"Username [{current_user}]: ").strip() or current_user
+            else:
+                user = input("Username: ").strip()
 
-    elif choice == "2":
-        # Username + Password
-        current_user = current_env.get("JENKINS_USER", "")
-        if current_user:
-            user = input(f"Username [{current_user}]: ").strip() or current_user
-        else:
-            user = input("Username: ").strip()
+            if not user:
+                print("Error: Username is required", file=sys.stderr)
+                return 1
 
-        if not user:
-            print("Error: Username is required", file=sys.stderr)
-            return 1
+            current_token = current_env.get("JENKINS_TOKEN", "")
+            if current_token:
+                token = getpass.getpass(f"API Token [current token set]: ").strip() or current_token
+            else:
+                token = getpass.getpass("API Token: ").strip()
 
-        password = getpass.getpass("Password: ").strip()
+            if not token:
+                print("Error: API Token is required", file=sys.stderr)
+                return 1
 
-        if not password:
-            print("Error: Password is required", file=sys.stderr)
-            return 1
+            env_vars["JENKINS_USER"] = user
+            env_vars["JENKINS_TOKEN"] = token
 
-        # Create base64 auth
-        import base64
-        auth_string = f"{user}:{password}"
-        auth_b64 = base64.b64encode(auth_string.encode()).decode()
+        elif choice == "2":
+            # Username + Password
+            current_user = current_env.get("JENKINS_USER", "")
+            if current_user:
+                user = input(f"Username [{current_user}]: ").strip() or current_user
+            else:
+                user = input("Username: ").strip()
 
-        env_vars["JENKINS_AUTH"] = auth_b64
+            if not user:
+                print("Error: Username is required", file=sys.stderr)
+                return 1
 
-    elif choice == "3":
-        # Base64 encoded
-        current_auth = current_env.get("JENKINS_AUTH", "")
-        if current_auth:
-            auth_b64 = input(f"Base64 encoded credentials [current set]: ").strip() or current_auth
-        else:
-            auth_b64 = input("Base64 encoded credentials (username:password): ").strip()
+            password = getpass.getpass("Password: ").strip()
 
-        if not auth_b64:
-            print("Error: Base64 encoded credentials are required", file=sys.stderr)
-            return 1
+            if not password:
+                print("Error: Password is required", file=sys.stderr)
+                return 1
 
-        env_vars["JENKINS_AUTH"] = auth_b64
+            # Create base64 auth; binascii skips the base64 module import
+            import binascii
+            auth_string = f"{user}:{password}"
+            auth_b64 = binascii.b2a_base64(
+                auth_string.encode('utf-8'), newline=False
+            ).decode('ascii')
+
+            env_vars["JENKINS_AUTH"] = auth_b64
+
+        elif choice == "3":
+            # Base64 encoded
+            current_auth = current_env.get("JENKINS_AUTH", "")
+            if current_auth:
+                auth_b64 = input(f"Base64 encoded credentials [current set]: ").strip() or current_auth
+            else:
+                auth_b64 = input("Base64 encoded credentials (username:password): ").strip()
+
+            if not auth_b64:
+                print("Error: Base64 encoded credentials are required", file=sys.stderr)
+                return 1
+
+            env_vars["JENKINS_AUTH"] = auth_b64
 
     # Save to .env file
     if save_env_file(env_vars):
+        # Invalidate the cached parse so any client built later in this
+        # process (e.g. the --test probe) sees the new values
+        clear_env_cache()
         env_file_path = get_env_file_path()
         print(f"\n✅ Credentials saved to: {env_file_path}")
         print("You can now use Jenkins commands without setting environment variables.")
-
-        # Test connection
-        print("\nTesting connection...")
-        try:
-            # Temporarily set env vars for testing
-            old_env = {}
-            for key, value in env_vars.items():
-                old_env[key] = os.environ.get(key)
-                os.environ[key] = value
-
-            client = JenkinsClient()
-            version = client.client.version
-            print(f"✅ Connection successful! Jenkins version: {version}")
-
-            # Restore old env vars
-            for key, value in old_env.items():
-                if value is not None:
-                    os.environ[key] = value
-                elif key in os.environ:
-                    del os.environ[key]
-
-        except Exception as e:
-            print(f"❌ Connection test failed: {e}")
-            print("Please check your credentials and try again.")
+        if test_connection:
+            _test_connection(env_vars)
+        else:
+            print("Use 'ngen-j login --test' to also verify the connection, or run 'ngen-j check'.")
 
         return 0
     else:
@@ -210,935 +446,825 @@ def handle_check_command(args: list) -> int:
     Returns:
         Exit code
     """
-    print("ngen-j Jenkins Connection Check")
-    print("==============================")
+    # Accumulate the banner and status lines and emit them with a single
+    # write instead of one syscall per print
+    out = ["ngen-j Jenkins Connection Check", "=============================="]
 
     try:
-        # Try to create Jenkins client (will load from .env or env vars)
-        client = JenkinsClient()
+        # Get shared Jenkins client (will load from .env or env vars)
+        client = _client()
 
-        print(f"✅ Connected to Jenkins: {client.url}")
-        print(f"   User: {client.user or 'N/A'}")
+        out.append(f"✅ Connected to Jenkins: {client.url}")
+        out.append(f"   User: {client.user or 'N/A'}")
 
-        # Get Jenkins version
-        try:
-            # Try different ways to get version
-            if hasattr(client.client, 'version'):
-                version = client.client.version
-            else:
-                # Fallback: try to get server info
-                info = client.client.api_json()
-                version = info.get('version', 'Unknown')
-            print(f"   Version: {version}")
-        except Exception as e:
-            print(f"   Version: Unable to retrieve ({e})")
+        # Fetch server info once with a minimal tree filter; job count
+        # and the API-access probe are both derived from this payload.
+        # The version read is an independent call, so run the two
+        # concurrently - over a WAN this makes check cost ~one round trip
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            info_future = executor.submit(
+                client.client.api_json, tree='mode,nodeDescription,jobs[name,url]')
+            # api4jenkins reads the version from the X-Jenkins header
+            version_future = executor.submit(lambda: client.client.version)
 
-        # Try to get basic info
         try:
-            # Get number of jobs using correct API
-            jobs = client.list_jobs()
-            jobs_count = len(jobs)
-            print(f"   Jobs: {jobs_count} job(s) found")
+            info = info_future.result()
         except Exception as e:
-            print(f"   Jobs: Unable to retrieve ({e})")
+            out.append(f"   API Access: ❌ Failed ({e})")
+            sys.stdout.write("\n".join(out) + "\n")
+            return 1
 
-        # Test API access with a simple call
+        # Get Jenkins version
         try:
-            # Test with a simple API call that should work
-            if hasattr(client.client, 'api_json'):
-                info = client.client.api_json()
-                if 'mode' in info or 'nodeDescription' in info:
-                    print("   API Access: ✅ OK")
-                else:
-                    print("   API Access: ⚠️  Limited (basic info only)")
-            else:
-                # Fallback: try to list jobs as API test
-                jobs = client.list_jobs()
-                print("   API Access: ✅ OK")
+            version = version_future.result()
+            out.append(f"   Version: {version}")
         except Exception as e:
-            print(f"   API Access: ❌ Failed ({e})")
-            return 1
+            out.append(f"   Version: Unable to retrieve ({e})")
+
+        jobs_count = len(info.get('jobs', []))
+        out.append(f"   Jobs: {jobs_count} job(s) found")
+
+        if 'mode' in info or 'nodeDescription' in info:
+            out.append("   API Access: ✅ OK")
+        else:
+            out.append("   API Access: ⚠️  Limited (basic info only)")
 
-        print("\n🎉 Jenkins connection is working correctly!")
-        print("You can now use Jenkins commands.")
+        out.append("\n🎉 Jenkins connection is working correctly!")
+        out.append("You can now use Jenkins commands.")
+        sys.stdout.write("\n".join(out) + "\n")
 
         return 0
 
     except Exception as e:
-        print(f"❌ Jenkins connection failed: {e}")
-        print("\nTroubleshooting:")
-        print("1. Check if Jenkins URL is correct and accessible")
-        print("2. Verify your credentials using 'ngen-j login'")
-        print("3. Ensure Jenkins user has API access permissions")
-        print("4. Check network connectivity and firewall settings")
-        print("5. For HTTPS, ensure SSL certificates are valid")
+        out.append(f"❌ Jenkins connection failed: {e}")
+        out.append("\nTroubleshooting:")
+        out.append("1. Check if Jenkins URL is correct and accessible")
+        out.append("2. Verify your credentials using 'ngen-j login'")
+        out.append("3. Ensure Jenkins user has API access permissions")
+        out.append("4. Check network connectivity and firewall settings")
+        out.append("5. For HTTPS, ensure SSL certificates are valid")
+        sys.stdout.write("\n".join(out) + "\n")
         return 1
 
 
-def main():
-    """Main entry point for ngen-j command."""
-    # Handle version flag
-    if len(sys.argv) >= 2 and sys.argv[1] in ("--version", "-V"):
-        print(f"ngen-j version {__version__}")
-        sys.exit(0)
-    
-    if len(sys.argv) < 2:
-        print("Usage: ngen-j <command> [args...]", file=sys.stderr)
-        print("\nngen-j is a Jenkins API management CLI tool.", file=sys.stderr)
-        print("\nBuilt-in commands:", file=sys.stderr)
-        print("  login             Save Jenkins credentials", file=sys.stderr)
-        print("  check             Validate Jenkins access", file=sys.stderr)
-        print("  jobs              List all Jenkins jobs", file=sys.stderr)
-        print("  job <name>        Get job details", file=sys.stderr)
-        print("  job --last-success Get last 10 successful jobs", file=sys.stderr)
-        print("  job --last-failure Get last 10 failed jobs", file=sys.stderr)
-        print("  build <job-name>  Trigger a build", file=sys.stderr)
-        print("  log <name> <num>  Get build console output", file=sys.stderr)
-        print("  get-xml <name>    Get job configuration XML", file=sys.stderr)
-        print("  create <name> <xml> Create/update job from XML", file=sys.stderr)
-        print("  delete <name>     Delete a job", file=sys.stderr)
-        print("  plugin list       List installed plugins", file=sys.stderr)
-        print("  plugin install   Install plugin(s)", file=sys.stderr)
-        print("  plugin uninstall Uninstall plugin(s)", file=sys.stderr)
-        print("                    Use --format json|csv and --output <file> for export", file=sys.stderr)
-        print("  cred list         List all credentials", file=sys.stderr)
-        print("  cred create       Create credential (interactive or non-interactive)", file=sys.stderr)
-        print("  cred delete <id>  Delete credential", file=sys.stderr)
-        print("\nScript commands:", file=sys.stderr)
-        print("  <script-name>     Execute bundled script", file=sys.stderr)
-        print("\nExamples:", file=sys.stderr)
-        print("  ngen-j --version", file=sys.stderr)
-        print("  ngen-j jobs", file=sys.stderr)
-        print("  ngen-j job my-job", file=sys.stderr)
-        print("  ngen-j job --last-success", file=sys.stderr)
-        print("  ngen-j job --last-failure", file=sys.stderr)
-        print("  ngen-j build my-job", file=sys.stderr)
-        print("  ngen-j build my-job --param REF_NAME=develop", file=sys.stderr)
-        print("  ngen-j build my-job --param=REF_NAME=develop", file=sys.stderr)
-        print("  ngen-j log my-job 42", file=sys.stderr)
-        print("  ngen-j get-xml my-job", file=sys.stderr)
-        print("  ngen-j create my-job job.xml", file=sys.stderr)
-        print("  ngen-j delete my-job", file=sys.stderr)
-        print("  ngen-j delete my-job --force", file=sys.stderr)
-        print("  ngen-j plugin list", file=sys.stderr)
-        print("  ngen-j plugin list --format json --output plugins.json", file=sys.stderr)
-        print("  ngen-j plugin list --format csv --output plugins.csv", file=sys.stderr)
-        print("  ngen-j plugin install git", file=sys.stderr)
-        print("  ngen-j plugin uninstall git", file=sys.stderr)
-        print("  ngen-j cred list", file=sys.stderr)
-        print("  ngen-j cred create", file=sys.stderr)
-        print("  ngen-j cred delete my-cred", file=sys.stderr)
-        sys.exit(0)
-    
-    command = sys.argv[1]
-    
-    # Handle help flags
-    if command in ("-h", "--help", "help"):
-        print("Usage: ngen-j <command> [args...]", file=sys.stderr)
-        print("\nngen-j is a Jenkins API management CLI tool.", file=sys.stderr)
-        print("\nBuilt-in commands:", file=sys.stderr)
-        print("  login             Save Jenkins credentials", file=sys.stderr)
-        print("  check             Validate Jenkins access", file=sys.stderr)
-        print("  jobs              List all Jenkins jobs", file=sys.stderr)
-        print("  job <name>        Get job details", file=sys.stderr)
-        print("  job --last-success Get last 10 successful jobs", file=sys.stderr)
-        print("  job --last-failure Get last 10 failed jobs", file=sys.stderr)
-        print("  build <job-name>  Trigger a build", file=sys.stderr)
-        print("  log <name> <num>  Get build console output", file=sys.stderr)
-        print("  get-xml <name>    Get job configuration XML", file=sys.stderr)
-        print("  create <name> <xml> Create/update job from XML", file=sys.stderr)
-        print("  delete <name>     Delete a job", file=sys.stderr)
-        print("  plugin list       List installed plugins", file=sys.stderr)
-        print("  plugin install   Install plugin(s)", file=sys.stderr)
-        print("  plugin uninstall Uninstall plugin(s)", file=sys.stderr)
-        print("                    Use --format json|csv and --output <file> for export", file=sys.stderr)
-        print("  cred list         List all credentials", file=sys.stderr)
-        print("  cred create       Create credential (interactive or non-interactive)", file=sys.stderr)
-        print("  cred delete <id>  Delete credential", file=sys.stderr)
-        print("\nScript commands:", file=sys.stderr)
-        print("  <script-name>     Execute bundled script", file=sys.stderr)
-        print("\nExamples:", file=sys.stderr)
-        print("  ngen-j --version", file=sys.stderr)
-        print("  ngen-j jobs", file=sys.stderr)
-        print("  ngen-j job my-job", file=sys.stderr)
-        print("  ngen-j job --last-success", file=sys.stderr)
-        print("  ngen-j job --last-failure", file=sys.stderr)
-        print("  ngen-j build my-job", file=sys.stderr)
-        print("  ngen-j build my-job --param REF_NAME=develop", file=sys.stderr)
-        print("  ngen-j build my-job --param=REF_NAME=develop", file=sys.stderr)
-        print("  ngen-j log my-job 42", file=sys.stderr)
-        print("  ngen-j get-xml my-job", file=sys.stderr)
-        print("  ngen-j create my-job job.xml", file=sys.stderr)
-        print("  ngen-j delete my-job", file=sys.stderr)
-        print("  ngen-j delete my-job --force", file=sys.stderr)
-        print("  ngen-j plugin list", file=sys.stderr)
-        print("  ngen-j plugin list --format json --output plugins.json", file=sys.stderr)
-        print("  ngen-j plugin list --format csv --output plugins.csv", file=sys.stderr)
-        print("  ngen-j plugin install git", file=sys.stderr)
-        print("  ngen-j plugin uninstall git", file=sys.stderr)
-        print("  ngen-j cred list", file=sys.stderr)
-        print("  ngen-j cred create", file=sys.stderr)
-        print("  ngen-j cred delete my-cred", file=sys.stderr)
-        sys.exit(0)
-    
-    # Handle login command
-    if command == "login":
-        exit_code = handle_login_command(sys.argv[2:])
-        sys.exit(exit_code)
-
-    # Handle check command
-    if command == "check":
-        exit_code = handle_check_command(sys.argv[2:])
-        sys.exit(exit_code)
-
-    # Handle jobs command
-    if command == "jobs":
-        client = JenkinsClient()
-        jobs = client.list_jobs()
-        if jobs:
-            print("Jenkins Jobs:")
-            for job in jobs:
-                print(f"  {job['name']} - {job['url']}")
-        else:
-            print("No jobs found")
-        sys.exit(0)
+def _cmd_jobs(args: list) -> int:
+    """Handle jobs command: list all Jenkins jobs."""
+    client = _client()
+    jobs = client.list_jobs()
+    if jobs:
+        # One buffered write instead of a print (and syscall) per job
+        lines = [f"  {job['name']} - {job['url']}" for job in jobs]
+        sys.stdout.write("Jenkins Jobs:\n" + "\n".join(lines) + "\n")
+    else:
+        print("No jobs found")
+    return 0
 
-    # Handle job command
-    if command == "job":
-        args = sys.argv[2:]
 
-        # Check for flags
-        if '--last-success' in args:
-            args.remove('--last-success')
-            client = JenkinsClient()
-            jobs_info = client.get_recent_jobs_by_status('SUCCESS', 10)
-            print("Last 10 Successful Jobs:")
-            print("=" * 80)
-            for i, job_info in enumerate(jobs_info, 1):
-                print(f"{i}. {job_info['name']}")
-                print(f"   URL: {job_info['url']}")
-                if job_info.get('description'):
-                    print(f"   Description: {job_info['description']}")
-                print(f"   Buildable: {job_info.get('buildable', False)}")
-                last_build = job_info.get('last_build', {})
-                if last_build:
-                    status = last_build['status']
-                    # Colorize status
-                    if status == 'SUCCESS':
-                        status_display = f"\033[92m{status}\033[0m"  # Green
-                    elif status == 'FAILURE':
-                        status_display = f"\033[91m{status}\033[0m"  # Red
-                    elif status == 'BUILDING':
-                        status_display = f"\033[93m{status}\033[0m"  # Yellow
-                    else:
-                        status_display = status
-
-                    print(f"   Last Build: #{last_build.get('number', 'N/A')} - {status_display}")
-                    print(f"   Build Time: {last_build.get('start_time', 'N/A')}")
-                    print(f"   Duration: {last_build.get('duration', 'N/A')}")
-                print()
-            if not jobs_info:
-                print("No successful jobs found.")
-            sys.exit(0)
-
-        elif '--last-failure' in args:
-            args.remove('--last-failure')
-            client = JenkinsClient()
-            jobs_info = client.get_recent_jobs_by_status('FAILURE', 10)
-            print("Last 10 Failed Jobs:")
-            print("=" * 80)
-            for i, job_info in enumerate(jobs_info, 1):
-                print(f"{i}. {job_info['name']}")
-                print(f"   URL: {job_info['url']}")
-                if job_info.get('description'):
-                    print(f"   Description: {job_info['description']}")
-                print(f"   Buildable: {job_info.get('buildable', False)}")
-                last_build = job_info.get('last_build', {})
-                if last_build:
-                    status = last_build['status']
-                    # Colorize status
-                    if status == 'SUCCESS':
-                        status_display = f"\033[92m{status}\033[0m"  # Green
-                    elif status == 'FAILURE':
-                        status_display = f"\033[91m{status}\033[0m"  # Red
-                    elif status == 'BUILDING':
-                        status_display = f"\033[93m{status}\033[0m"  # Yellow
-                    else:
-                        status_display = status
-
-                    print(f"   Last Build: #{last_build.get('number', 'N/A')} - {status_display}")
-                    print(f"   Build Time: {last_build.get('start_time', 'N/A')}")
-                    print(f"   Duration: {last_build.get('duration', 'N/A')}")
-                print()
-            if not jobs_info:
-                print("No failed jobs found.")
-            sys.exit(0)
-
-        # Default behavior: get specific job
-        if not args:
-            print("Error: job name required or use --last-success/--last-failure", file=sys.stderr)
-            print("Usage: ngen-j job <name>", file=sys.stderr)
-            print("       ngen-j job --last-success", file=sys.stderr)
-            print("       ngen-j job --last-failure", file=sys.stderr)
-            sys.exit(1)
-
-        job_name = args[0]
-        client = JenkinsClient()
-        job_info = client.get_job(job_name)
-        print(f"Job: {job_info['name']}")
-        print(f"URL: {job_info['url']}")
+def _write_jobs_listing(jobs_info: list, title: str, empty_message: str) -> None:
+    """
+    Emit a recent-jobs listing with a single stdout write.
+
+    Args:
+        jobs_info: Job dictionaries from get_recent_jobs_by_status
+        title: Heading line for the listing
+        empty_message: Line printed when no jobs matched
+    """
+    out = [title, "=" * 80]
+    for i, job_info in enumerate(jobs_info, 1):
+        out.append(f"{i}. {job_info['name']}")
+        out.append(f"   URL: {job_info['url']}")
         if job_info.get('description'):
-            print(f"Description: {job_info['description']}")
-        print(f"Buildable: {job_info.get('buildable', False)}")
-
-        # Display recent builds
-        recent_builds = job_info.get('recent_builds', [])
-        if recent_builds:
-            print("\nRecent Builds:")
-            print("-" * 70)
-            print(f"{'Build #':<10} {'Status':<12} {'Start Time':<20} {'Duration':<15}")
-            print("-" * 70)
-            for build in recent_builds:
-                status = build['status']
-                # Colorize status
-                if status == 'SUCCESS':
-                    status_display = f"\033[92m{status}\033[0m"  # Green
-                elif status == 'FAILURE':
-                    status_display = f"\033[91m{status}\033[0m"  # Red
-                elif status == 'BUILDING':
-                    status_display = f"\033[93m{status}\033[0m"  # Yellow
-                else:
-                    status_display = status
+            out.append(f"   Description: {job_info['description']}")
+        out.append(f"   Buildable: {job_info.get('buildable', False)}")
+        last_build = job_info.get('last_build', {})
+        if last_build:
+            status_display = _colorize(last_build['status'])
+            out.append(f"   Last Build: #{last_build.get('number', 'N/A')} - {status_display}")
+            out.append(f"   Build Time: {last_build.get('start_time', 'N/A')}")
+            out.append(f"   Duration: {last_build.get('duration', 'N/A')}")
+        out.append("")
+    if not jobs_info:
+        out.append(empty_message)
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _cmd_job(args: list) -> int:
+    """Handle job command: get job details or recent jobs by status."""
+    # One client serves every branch below
+    client = _client()
+
+    # Single pass: split flags from positionals
+    flags = {a for a in args if a.startswith('--')}
+    args = [a for a in args if not a.startswith('--')]
+
+    if '--last-success' in flags:
+        jobs_info = client.get_recent_jobs_by_status('SUCCESS', 10)
+        _write_jobs_listing(jobs_info, "Last 10 Successful Jobs:", "No successful jobs found.")
+        return 0
 
-                print(f"{build['number']:<10} {status_display:<12} {build['start_time']:<20} {build['duration']:<15}")
-        else:
-            print("\nNo recent builds found.")
+    elif '--last-failure' in flags:
+        jobs_info = client.get_recent_jobs_by_status('FAILURE', 10)
+        _write_jobs_listing(jobs_info, "Last 10 Failed Jobs:", "No failed jobs found.")
+        return 0
+
+    # Default behavior: get specific job
+    if not args:
+        print("Error: job name required or use --last-success/--last-failure", file=sys.stderr)
+        print("Usage: ngen-j job <name>", file=sys.stderr)
+        print("       ngen-j job --last-success", file=sys.stderr)
+        print("       ngen-j job --last-failure", file=sys.stderr)
+        return 1
+
+    job_name = args[0]
+    job_info = client.get_job(job_name)
+    print(f"Job: {job_info['name']}")
+    print(f"URL: {job_info['url']}")
+    if job_info.get('description'):
+        print(f"Description: {job_info['description']}")
+    print(f"Buildable: {job_info.get('buildable', False)}")
+
+    # Display recent builds
+    recent_builds = job_info.get('recent_builds', [])
+    if recent_builds:
+        import io
+
+        buf = io.StringIO()
+        buf.write("\nRecent Builds:\n")
+        buf.write("-" * 70 + "\n")
+        buf.write(f"{'Build #':<10} {'Status':<12} {'Start Time':<20} {'Duration':<15}\n")
+        buf.write("-" * 70 + "\n")
+        for build in recent_builds:
+            status = build['status']
+            # Pad by the plain status width: ANSI escapes are invisible
+            # on the terminal but not to format-spec padding
+            pad = ' ' * max(12 - len(status), 0)
+            buf.write(f"{build['number']:<10} ")
+            buf.write(_colorize(status))
+            buf.write(pad)
+            buf.write(f" {build['start_time']:<20} {build['duration']:<15}\n")
+        sys.stdout.write(buf.getvalue())
+    else:
+        print("\nNo recent builds found.")
+
+    return 0
 
-        sys.exit(0)
 
-    # Handle build command
-    if command == "build":
-        # Parse arguments for --param flags
-        args = sys.argv[2:]
-        parameters = {}
-
-        # Extract --param KEY=VALUE arguments
-        filtered_args = []
-        i = 0
-        while i < len(args):
-            arg = args[i]
-            if arg == '--param':
-                # Handle --param KEY1=VALUE1 KEY2=VALUE2 format (can have multiple parameters)
+def _cmd_build(args: list) -> int:
+    """Handle build command: trigger a build with optional parameters."""
+    # Parse arguments for --param flags
+    parameters = {}
+
+    # Extract --param KEY=VALUE arguments
+    filtered_args = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '--param':
+            # Handle --param KEY1=VALUE1 KEY2=VALUE2 format (can have multiple parameters)
+            i += 1
+            # Collect following KEY=VALUE arguments until we hit another
+            # flag or the job name; partition scans each string once
+            while i < len(args):
+                next_arg = args[i]
+                if next_arg.startswith('--'):
+                    break
+                key, sep, value = next_arg.partition('=')
+                if not sep:
+                    break
+                parameters[key] = value
                 i += 1
-                # Collect all following arguments that contain '=' until we hit another flag or job name
-                while i < len(args):
-                    next_arg = args[i]
-                    if next_arg.startswith('--') or '=' not in next_arg:
-                        # Stop if we hit another flag or argument without '='
-                        break
-                    if '=' in next_arg:
-                        key, value = next_arg.split('=', 1)
-                        parameters[key] = value
-                    i += 1
-                continue
-            elif arg.startswith('--param='):
-                # Parse --param=KEY=VALUE format
-                param_str = arg[8:]  # Remove '--param=' prefix
-                if '=' in param_str:
-                    key, value = param_str.split('=', 1)
-                    parameters[key] = value
-                else:
-                    print(f"Error: Invalid parameter format '{arg}'. Use --param=KEY=VALUE", file=sys.stderr)
-                    sys.exit(1)
+            continue
+        elif arg.startswith('--param='):
+            # Parse --param=KEY=VALUE format
+            param_str = arg.removeprefix('--param=')
+            key, sep, value = param_str.partition('=')
+            if sep:
+                parameters[key] = value
             else:
-                filtered_args.append(arg)
-            i += 1
+                print(f"Error: Invalid parameter format '{arg}'. Use --param=KEY=VALUE", file=sys.stderr)
+                return 1
+        else:
+            filtered_args.append(arg)
+        i += 1
 
-        if len(filtered_args) != 1:
-            print("Usage: ngen-j build <job-name> [--param KEY1=VALUE1 KEY2=VALUE2 ...] or [--param=KEY=VALUE ...]", file=sys.stderr)
-            print("  --param KEY=VALUE ...  Pass multiple build parameters after single --param flag", file=sys.stderr)
-            print("  --param=KEY=VALUE      Alternative format for build parameters", file=sys.stderr)
-            sys.exit(1)
-
-        job_name = filtered_args[0]
-        client = JenkinsClient()
-        build_info = client.trigger_build(job_name, parameters if parameters else None)
-
-        print(f"Build triggered for job: {job_name}")
-        if parameters:
-            print("Parameters:")
-            for key, value in parameters.items():
-                print(f"  {key}={value}")
-        print(f"Queue ID: {build_info['queue_id']}")
-        print(f"Queue URL: {build_info['url']}")
-        sys.exit(0)
+    if len(filtered_args) != 1:
+        print("Usage: ngen-j build <job-name> [--param KEY1=VALUE1 KEY2=VALUE2 ...] or [--param=KEY=VALUE ...]", file=sys.stderr)
+        print("  --param KEY=VALUE ...  Pass multiple build parameters after single --param flag", file=sys.stderr)
+        print("  --param=KEY=VALUE      Alternative format for build parameters", file=sys.stderr)
+        return 1
 
-    # Handle create command
-    if command == "create":
-        # Parse arguments for --force flag
-        force = False
-        args = sys.argv[2:]
+    job_name = filtered_args[0]
+    client = _client()
+    build_info = client.trigger_build(job_name, parameters if parameters else None)
+
+    print(f"Build triggered for job: {job_name}")
+    if parameters:
+        print("Parameters:")
+        for key, value in parameters.items():
+            print(f"  {key}={value}")
+    print(f"Queue ID: {build_info['queue_id']}")
+    print(f"Queue URL: {build_info['url']}")
+    return 0
+
+
+def _cmd_create(args: list) -> int:
+    """Handle create command: create or update a job from XML."""
+    # Single pass: split flags from positionals
+    force = '--force' in args
+    args = [a for a in args if not a.startswith('--')]
+
+    if len(args) != 2:
+        print("Usage: ngen-j create <job-name> <xml-file> [--force]", file=sys.stderr)
+        print("  --force    Skip confirmation when updating existing job", file=sys.stderr)
+        return 1
 
-        if '--force' in args:
-            force = True
-            args.remove('--force')
+    job_name = args[0]
+    xml_file = args[1]
 
-        if len(args) != 2:
-            print("Usage: ngen-j create <job-name> <xml-file> [--force]", file=sys.stderr)
-            print("  --force    Skip confirmation when updating existing job", file=sys.stderr)
-            sys.exit(1)
+    # Read XML file
+    try:
+        xml_path = Path(xml_file)
+        if xml_path.stat().st_size > 1_048_576:
+            # Large pipeline configs: map the file instead of paging it
+            # through an intermediate Python buffer
+            import mmap
+            with open(xml_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    xml_content = mm[:].decode('utf-8')
+        else:
+            xml_content = xml_path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        print(f"Error: XML file '{xml_file}' not found", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error reading XML file: {e}", file=sys.stderr)
+        return 1
 
-        job_name = args[0]
-        xml_file = args[1]
+    # Create/update job
+    client = _client()
+    result = client.create_job_from_xml(job_name, xml_content, force)
 
-        # Read XML file
-        try:
-            with open(xml_file, 'r', encoding='utf-8') as f:
-                xml_content = f.read()
-        except FileNotFoundError:
-            print(f"Error: XML file '{xml_file}' not found", file=sys.stderr)
-            sys.exit(1)
-        except Exception as e:
-            print(f"Error reading XML file: {e}", file=sys.stderr)
-            sys.exit(1)
+    if result['status'] == 'success':
+        print(f"✅ Job '{job_name}' {result['action']} successfully!")
+        print(f"   URL: {result['url']}")
+    elif result['status'] == 'cancelled':
+        print(f"ℹ️  {result['message']}")
+    else:
+        print(f"❌ Failed to create/update job: {result.get('error', 'Unknown error')}")
+        return 1
 
-        # Create/update job
-        client = JenkinsClient()
-        result = client.create_job_from_xml(job_name, xml_content, force)
+    return 0
 
-        if result['status'] == 'success':
-            print(f"✅ Job '{job_name}' {result['action']} successfully!")
-            print(f"   URL: {result['url']}")
-        elif result['status'] == 'cancelled':
-            print(f"ℹ️  {result['message']}")
-        else:
-            print(f"❌ Failed to create/update job: {result.get('error', 'Unknown error')}")
-            sys.exit(1)
 
-        sys.exit(0)
+def _cmd_delete(args: list) -> int:
+    """Handle delete command: delete a job."""
+    # Single pass: split flags from positionals
+    force = '--force' in args
+    args = [a for a in args if not a.startswith('--')]
 
-    # Handle delete command
-    if command == "delete":
-        # Parse arguments for --force flag
-        force = False
-        args = sys.argv[2:]
+    if len(args) != 1:
+        print("Usage: ngen-j delete <job-name> [--force]", file=sys.stderr)
+        print("  --force    Skip confirmation before deleting job", file=sys.stderr)
+        return 1
 
-        if '--force' in args:
-            force = True
-            args.remove('--force')
+    job_name = args[0]
 
-        if len(args) != 1:
-            print("Usage: ngen-j delete <job-name> [--force]", file=sys.stderr)
-            print("  --force    Skip confirmation before deleting job", file=sys.stderr)
-            sys.exit(1)
+    # Delete job
+    client = _client()
+    result = client.delete_job(job_name, force)
 
-        job_name = args[0]
+    if result['status'] == 'success':
+        print(f"✅ Job '{job_name}' deleted successfully!")
+    elif result['status'] == 'cancelled':
+        print(f"ℹ️  {result['message']}")
+    else:
+        print(f"❌ Failed to delete job: {result.get('error', 'Unknown error')}")
 
-        # Delete job
-        client = JenkinsClient()
-        result = client.delete_job(job_name, force)
+    return 0
 
-        if result['status'] == 'success':
-            print(f"✅ Job '{job_name}' deleted successfully!")
-        elif result['status'] == 'cancelled':
-            print(f"ℹ️  {result['message']}")
-        else:
-            print(f"❌ Failed to delete job: {result.get('error', 'Unknown error')}")
 
-        sys.exit(0)
+def _cmd_get_xml(args: list) -> int:
+    """Handle get-xml command: print job configuration XML."""
+    if not args:
+        print("Error: job name required", file=sys.stderr)
+        print("Usage: ngen-j get-xml <job-name>", file=sys.stderr)
+        return 1
+    job_name = args[0]
+    client = _client()
+    xml_content = client.get_job_xml(job_name)
+    print(xml_content)
+    return 0
+
+
+def _cmd_log(args: list) -> int:
+    """Handle log command: print build console output."""
+    if len(args) < 2:
+        print("Error: job name and build number required", file=sys.stderr)
+        print("Usage: ngen-j log <job-name> <build-number>", file=sys.stderr)
+        return 1
+    job_name = args[0]
+    try:
+        build_number = int(args[1])
+    except ValueError:
+        print("Error: build number must be an integer", file=sys.stderr)
+        return 1
 
-    # Handle get-xml command
-    if command == "get-xml":
-        if len(sys.argv) < 3:
-            print("Error: job name required", file=sys.stderr)
-            print("Usage: ngen-j get-xml <job-name>", file=sys.stderr)
-            sys.exit(1)
-        job_name = sys.argv[2]
-        client = JenkinsClient()
-        xml_content = client.get_job_xml(job_name)
-        print(xml_content)
-        sys.exit(0)
+    client = _client()
+    sys.stdout.write(f"Console output for {job_name} build #{build_number}:\n" + "=" * 80 + "\n")
+    sys.stdout.flush()
+    # Write raw chunks as they arrive: bounded memory instead of one
+    # log-sized string, and no decode/re-encode round trip
+    out = sys.stdout.buffer
+    for chunk in client.stream_build_logs(job_name, build_number):
+        out.write(chunk)
+    out.flush()
+    return 0
+
+
+def _cmd_cred(args: list) -> int:
+    """Handle cred command: manage Jenkins credentials."""
+    if not args:
+        print("Error: cred subcommand required", file=sys.stderr)
+        print("Usage: ngen-j cred <list|create|delete> [args...]", file=sys.stderr)
+        print("\nCredential management commands:", file=sys.stderr)
+        print("  list                    List all credentials", file=sys.stderr)
+        print("  create                  Create a new credential (interactive)", file=sys.stderr)
+        print("  delete <id>             Delete a credential", file=sys.stderr)
+        print("\nCreate credential options (non-interactive):", file=sys.stderr)
+        print("  --type <type>           Credential type: username_password, secret_text, ssh_key", file=sys.stderr)
+        print("  --id <id>               Credential ID", file=sys.stderr)
+        print("  --description <desc>   Description", file=sys.stderr)
+        print("  --username <user>      Username (for username_password, ssh_key)", file=sys.stderr)
+        print("  --password <pass>      Password (for username_password)", file=sys.stderr)
+        print("  --secret <secret>      Secret text (for secret_text)", file=sys.stderr)
+        print("  --private-key <key>   Private key content (for ssh_key)", file=sys.stderr)
+        print("  --private-key-file <file>  Private key file path (for ssh_key)", file=sys.stderr)
+        print("  --passphrase <phrase>  Passphrase for encrypted private key (for ssh_key)", file=sys.stderr)
+        print("  --force                Overwrite existing credential", file=sys.stderr)
+        return 1
 
-    # Handle log command
-    if command == "log":
-        if len(sys.argv) < 4:
-            print("Error: job name and build number required", file=sys.stderr)
-            print("Usage: ngen-j log <job-name> <build-number>", file=sys.stderr)
-            sys.exit(1)
-        job_name = sys.argv[2]
-        try:
-            build_number = int(sys.argv[3])
-        except ValueError:
-            print("Error: build number must be an integer", file=sys.stderr)
-            sys.exit(1)
-
-        client = JenkinsClient()
-        logs = client.get_build_logs(job_name, build_number)
-        print(f"Console output for {job_name} build #{build_number}:")
-        print("=" * 80)
-        print(logs)
-        sys.exit(0)
+    subcommand = args[0]
+    client = _client()
 
-    # Handle cred command
-    if command == "cred":
-        if len(sys.argv) < 3:
-            print("Error: cred subcommand required", file=sys.stderr)
-            print("Usage: ngen-j cred <list|create|delete> [args...]", file=sys.stderr)
-            print("\nCredential management commands:", file=sys.stderr)
-            print("  list                    List all credentials", file=sys.stderr)
-            print("  create                  Create a new credential (interactive)", file=sys.stderr)
-            print("  delete <id>             Delete a credential", file=sys.stderr)
-            print("\nCreate credential options (non-interactive):", file=sys.stderr)
-            print("  --type <type>           Credential type: username_password, secret_text, ssh_key", file=sys.stderr)
-            print("  --id <id>               Credential ID", file=sys.stderr)
-            print("  --description <desc>   Description", file=sys.stderr)
-            print("  --username <user>      Username (for username_password, ssh_key)", file=sys.stderr)
-            print("  --password <pass>      Password (for username_password)", file=sys.stderr)
-            print("  --secret <secret>      Secret text (for secret_text)", file=sys.stderr)
-            print("  --private-key <key>   Private key content (for ssh_key)", file=sys.stderr)
-            print("  --private-key-file <file>  Private key file path (for ssh_key)", file=sys.stderr)
-            print("  --passphrase <phrase>  Passphrase for encrypted private key (for ssh_key)", file=sys.stderr)
-            print("  --force                Overwrite existing credential", file=sys.stderr)
-            sys.exit(1)
-
-        subcommand = sys.argv[2]
-        client = JenkinsClient()
-
-        if subcommand == "list":
-            credentials = client.list_credentials()
-            
-            if credentials:
-                print("Jenkins Credentials:")
-                print("=" * 100)
-                print(f"{'ID':<30} {'Type':<25} {'Description':<40} {'Scope':<10}")
-                print("=" * 100)
-                for cred in credentials:
-                    cred_id = cred.get('id', 'N/A')
-                    cred_type = cred.get('type', 'N/A')
-                    # Extract readable type name
-                    if 'UsernamePassword' in cred_type:
-                        cred_type = 'Username/Password'
-                    elif 'StringCredentials' in cred_type:
-                        cred_type = 'Secret Text'
-                    elif 'SSHUserPrivateKey' in cred_type or 'BasicSSH' in cred_type:
-                        cred_type = 'SSH Key'
-                    else:
-                        cred_type = cred_type.split('.')[-1] if '.' in cred_type else cred_type
-                    
-                    description = cred.get('description', '')
-                    if len(description) > 38:
-                        description = description[:35] + "..."
-                    scope = cred.get('scope', 'GLOBAL')
-                    
-                    print(f"{cred_id:<30} {cred_type:<25} {description:<40} {scope:<10}")
-            else:
-                print("No credentials found.")
-            sys.exit(0)
+    if subcommand == "list":
+        credentials = client.list_credentials()
+        
+        if credentials:
+            print("Jenkins Credentials:")
+            print("=" * 100)
+            print(f"{'ID':<30} {'Type':<25} {'Description':<40} {'Scope':<10}")
+            print("=" * 100)
+            for cred in credentials:
+                cred_id = cred.get('id', 'N/A')
+                cred_type = cred.get('type', 'N/A')
+                # Extract readable type name
+                if 'UsernamePassword' in cred_type:
+                    cred_type = 'Username/Password'
+                elif 'StringCredentials' in cred_type:
+                    cred_type = 'Secret Text'
+                elif 'SSHUserPrivateKey' in cred_type or 'BasicSSH' in cred_type:
+                    cred_type = 'SSH Key'
+                else:
+                    cred_type = cred_type.split('.')[-1] if '.' in cred_type else cred_type
+                
+                description = cred.get('description', '')
+                if len(description) > 38:
+                    description = description[:35] + "..."
+                scope = cred.get('scope', 'GLOBAL')
+                
+                print(f"{cred_id:<30} {cred_type:<25} {description:<40} {scope:<10}")
+        else:
+            print("No credentials found.")
+        return 0
 
-        elif subcommand == "create":
-            args = sys.argv[3:]
+    elif subcommand == "create":
+        args = args[1:]
+        
+        # Check if non-interactive mode (has --type and --id)
+        is_interactive = True
+        if '--type' in args and '--id' in args:
+            is_interactive = False
+        
+        if is_interactive:
+            # Interactive mode
+            import getpass
             
-            # Check if non-interactive mode (has --type and --id)
-            is_interactive = True
-            if '--type' in args and '--id' in args:
-                is_interactive = False
+            print("Create Jenkins Credential (Interactive Mode)")
+            print("=" * 50)
             
-            if is_interactive:
-                # Interactive mode
-                import getpass
-                
-                print("Create Jenkins Credential (Interactive Mode)")
-                print("=" * 50)
-                
-                print("\nSelect credential type:")
-                print("1. Username/Password")
-                print("2. Secret Text")
-                print("3. SSH Username with Private Key")
-                
-                type_choice = input("Choice [1-3]: ").strip()
-                
-                cred_type_map = {
-                    '1': 'username_password',
-                    '2': 'secret_text',
-                    '3': 'ssh_key'
-                }
-                
-                if type_choice not in cred_type_map:
-                    print("Error: Invalid choice", file=sys.stderr)
-                    sys.exit(1)
-                
-                cred_type = cred_type_map[type_choice]
-                
-                cred_id = input("Credential ID: ").strip()
-                if not cred_id:
-                    print("Error: Credential ID is required", file=sys.stderr)
-                    sys.exit(1)
-                
-                description = input("Description (optional): ").strip()
-                
-                username = None
-                password = None
-                secret = None
-                private_key = None
-                private_key_file = None
-                passphrase = None
-                
-                if cred_type == 'username_password':
-                    username = input("Username: ").strip()
-                    password = getpass.getpass("Password: ")
-                    if not username or not password:
-                        print("Error: Username and password are required", file=sys.stderr)
-                        sys.exit(1)
-                
-                elif cred_type == 'secret_text':
-                    secret = getpass.getpass("Secret text: ")
-                    if not secret:
-                        print("Error: Secret text is required", file=sys.stderr)
-                        sys.exit(1)
-                
-                elif cred_type == 'ssh_key':
-                    username = input("Username: ").strip()
-                    key_source = input("Private key from [1] string or [2] file? [1]: ").strip() or '1'
-                    
-                    if key_source == '2':
-                        private_key_file = input("Private key file path: ").strip()
-                        if not private_key_file:
-                            print("Error: Private key file path is required", file=sys.stderr)
-                            sys.exit(1)
-                    else:
-                        print("Paste private key (end with empty line or Ctrl+D):")
-                        private_key_lines = []
-                        try:
-                            while True:
-                                line = input()
-                                if not line:
-                                    break
-                                private_key_lines.append(line)
-                        except EOFError:
-                            pass
-                        private_key = '\n'.join(private_key_lines)
-                        if not private_key:
-                            print("Error: Private key is required", file=sys.stderr)
-                            sys.exit(1)
-                    
-                    passphrase_input = getpass.getpass("Passphrase (optional, press Enter to skip): ").strip()
-                    if passphrase_input:
-                        passphrase = passphrase_input
-                    
-                    if not username:
-                        print("Error: Username is required", file=sys.stderr)
-                        sys.exit(1)
-                
-                # Check if credential exists
-                existing_creds = client.list_credentials()
-                cred_exists = any(c.get('id') == cred_id for c in existing_creds)
-                
-                force = False
-                if cred_exists:
-                    response = input(f"Credential '{cred_id}' already exists. Overwrite? (y/N): ").strip().lower()
-                    if response in ['y', 'yes']:
-                        force = True
-                    else:
-                        print("Credential creation cancelled.")
-                        sys.exit(0)
-                
-                result = client.create_credential(
-                    cred_type=cred_type,
-                    cred_id=cred_id,
-                    description=description,
-                    username=username,
-                    password=password,
-                    secret=secret,
-                    private_key=private_key,
-                    private_key_file=private_key_file,
-                    passphrase=passphrase,
-                    force=force
-                )
-                
-            else:
-                # Non-interactive mode
-                # Parse arguments
-                cred_type = None
-                cred_id = None
-                description = ""
-                username = None
-                password = None
-                secret = None
-                private_key = None
-                private_key_file = None
-                passphrase = None
-                force = False
-                
-                i = 0
-                while i < len(args):
-                    arg = args[i]
-                    if arg == '--type' and i + 1 < len(args):
-                        cred_type = args[i + 1]
-                        i += 2
-                    elif arg == '--id' and i + 1 < len(args):
-                        cred_id = args[i + 1]
-                        i += 2
-                    elif arg == '--description' and i + 1 < len(args):
-                        description = args[i + 1]
-                        i += 2
-                    elif arg == '--username' and i + 1 < len(args):
-                        username = args[i + 1]
-                        i += 2
-                    elif arg == '--password' and i + 1 < len(args):
-                        password = args[i + 1]
-                        i += 2
-                    elif arg == '--secret' and i + 1 < len(args):
-                        secret = args[i + 1]
-                        i += 2
-                    elif arg == '--private-key' and i + 1 < len(args):
-                        private_key = args[i + 1]
-                        i += 2
-                    elif arg == '--private-key-file' and i + 1 < len(args):
-                        private_key_file = args[i + 1]
-                        i += 2
-                    elif arg == '--passphrase' and i + 1 < len(args):
-                        passphrase = args[i + 1]
-                        i += 2
-                    elif arg == '--force':
-                        force = True
-                        i += 1
-                    else:
-                        print(f"Error: Unknown argument '{arg}'", file=sys.stderr)
-                        sys.exit(1)
-                
-                # Validate required fields
-                if not cred_type:
-                    print("Error: --type is required", file=sys.stderr)
-                    sys.exit(1)
-                
-                if not cred_id:
-                    print("Error: --id is required", file=sys.stderr)
-                    sys.exit(1)
+            print("\nSelect credential type:")
+            print("1. Username/Password")
+            print("2. Secret Text")
+            print("3. SSH Username with Private Key")
+            
+            type_choice = input("Choice [1-3]: ").strip()
+            
+            cred_type_map = {
+                '1': 'username_password',
+                '2': 'secret_text',
+                '3': 'ssh_key'
+            }
+            
+            if type_choice not in cred_type_map:
+                print("Error: Invalid choice", file=sys.stderr)
+                return 1
+            
+            cred_type = cred_type_map[type_choice]
+            
+            cred_id = input("Credential ID: ").strip()
+            if not cred_id:
+                print("Error: Credential ID is required", file=sys.stderr)
+                return 1
+            
+            description = input("Description (optional): ").strip()
+            
+            username = None
+            password = None
+            secret = None
+            private_key = None
+            private_key_file = None
+            passphrase = None
+            
+            if cred_type == 'username_password':
+                username = input("Username: ").strip()
+                password = getpass.getpass("Password: ")
+                if not username or not password:
+                    print("Error: Username and password are required", file=sys.stderr)
+                    return 1
+            
+            elif cred_type == 'secret_text':
+                secret = getpass.getpass("Secret text: ")
+                if not secret:
+                    print("Error: Secret text is required", file=sys.stderr)
+                    return 1
+            
+            elif cred_type == 'ssh_key':
+                username = input("Username: ").strip()
+                key_source = input("Private key from [1] string or [2] file? [1]: ").strip() or '1'
                 
-                # Normalize credential type
-                type_map = {
-                    'username_password': 'username_password',
-                    'username-password': 'username_password',
-                    'secret_text': 'secret_text',
-                    'secret-text': 'secret_text',
-                    'ssh_key': 'ssh_key',
-                    'ssh-key': 'ssh_key'
-                }
-                cred_type = type_map.get(cred_type.lower(), cred_type)
+                if key_source == '2':
+                    private_key_file = input("Private key file path: ").strip()
+                    if not private_key_file:
+                        print("Error: Private key file path is required", file=sys.stderr)
+                        return 1
+                else:
+                    print("Paste private key (end with empty line or Ctrl+D):")
+                    private_key_lines = []
+                    try:
+                        while True:
+                            line = input()
+                            if not line:
+                                break
+                            private_key_lines.append(line)
+                    except EOFError:
+                        pass
+                    private_key = '\n'.join(private_key_lines)
+                    if not private_key:
+                        print("Error: Private key is required", file=sys.stderr)
+                        return 1
                 
-                # Validate type-specific fields
-                if cred_type == 'username_password':
-                    if not username or not password:
-                        print("Error: --username and --password are required for username_password type", file=sys.stderr)
-                        sys.exit(1)
-                elif cred_type == 'secret_text':
-                    if not secret:
-                        print("Error: --secret is required for secret_text type", file=sys.stderr)
-                        sys.exit(1)
-                elif cred_type == 'ssh_key':
-                    if not username:
-                        print("Error: --username is required for ssh_key type", file=sys.stderr)
-                        sys.exit(1)
-                    if not private_key and not private_key_file:
-                        print("Error: --private-key or --private-key-file is required for ssh_key type", file=sys.stderr)
-                        sys.exit(1)
+                passphrase_input = getpass.getpass("Passphrase (optional, press Enter to skip): ").strip()
+                if passphrase_input:
+                    passphrase = passphrase_input
                 
-                result = client.create_credential(
-                    cred_type=cred_type,
-                    cred_id=cred_id,
-                    description=description,
-                    username=username,
-                    password=password,
-                    secret=secret,
-                    private_key=private_key,
-                    private_key_file=private_key_file,
-                    passphrase=passphrase,
-                    force=force
-                )
+                if not username:
+                    print("Error: Username is required", file=sys.stderr)
+                    return 1
             
-            if result.get('status') == 'success':
-                print(f"✅ {result.get('message', 'Credential created successfully')}")
-            elif result.get('status') == 'exists':
-                print(f"⚠️  {result.get('message', 'Credential already exists')}")
-                print("Use --force to overwrite", file=sys.stderr)
-                sys.exit(1)
-            else:
-                print(f"❌ Failed to create credential: {result.get('error', 'Unknown error')}")
-                sys.exit(1)
-            sys.exit(0)
-
-        elif subcommand == "delete":
-            if len(sys.argv) < 4:
-                print("Error: credential ID required", file=sys.stderr)
-                print("Usage: ngen-j cred delete <credential-id> [--force]", file=sys.stderr)
-                sys.exit(1)
+            # Check if credential exists
+            existing_creds = client.list_credentials()
+            cred_exists = any(c.get('id') == cred_id for c in existing_creds)
+            
+            force = False
+            if cred_exists:
+                response = input(f"Credential '{cred_id}' already exists. Overwrite? (y/N): ").strip().lower()
+                if response in ['y', 'yes']:
+                    force = True
+                else:
+                    print("Credential creation cancelled.")
+                    return 0
             
-            cred_id = sys.argv[3]
-            force = '--force' in sys.argv
+            result = client.create_credential(
+                cred_type=cred_type,
+                cred_id=cred_id,
+                description=description,
+                username=username,
+                password=password,
+                secret=secret,
+                private_key=private_key,
+                private_key_file=private_key_file,
+                passphrase=passphrase,
+                force=force
+            )
             
-            if not force:
-                response = input(f"Are you sure you want to delete credential '{cred_id}'? (y/N): ").strip().lower()
-                if response not in ['y', 'yes']:
-                    print("Credential deletion cancelled.")
-                    sys.exit(0)
+        else:
+            # Non-interactive mode: one pass over the flag list
+            opts, unknown = _parse_flags(
+                args,
+                ('--type', '--id', '--description', '--username', '--password',
+                 '--secret', '--private-key', '--private-key-file', '--passphrase'),
+                ('--force',),
+            )
+            if unknown:
+                print(f"Error: Unknown argument '{unknown[0]}'", file=sys.stderr)
+                return 1
+
+            cred_type = opts.get('type')
+            cred_id = opts.get('id')
+            description = opts.get('description', "")
+            username = opts.get('username')
+            password = opts.get('password')
+            secret = opts.get('secret')
+            private_key = opts.get('private-key')
+            private_key_file = opts.get('private-key-file')
+            passphrase = opts.get('passphrase')
+            force = opts.get('force', False)
             
-            result = client.delete_credential(cred_id, force=force)
+            # Validate required fields
+            if not cred_type:
+                print("Error: --type is required", file=sys.stderr)
+                return 1
             
-            if result.get('status') == 'success':
-                print(f"✅ {result.get('message', 'Credential deleted successfully')}")
-            else:
-                print(f"❌ Failed to delete credential: {result.get('error', 'Unknown error')}")
-                sys.exit(1)
-            sys.exit(0)
+            if not cred_id:
+                print("Error: --id is required", file=sys.stderr)
+                return 1
+            
+            # Normalize credential type
+            type_map = {
+                'username_password': 'username_password',
+                'username-password': 'username_password',
+                'secret_text': 'secret_text',
+                'secret-text': 'secret_text',
+                'ssh_key': 'ssh_key',
+                'ssh-key': 'ssh_key'
+            }
+            cred_type = type_map.get(cred_type.lower(), cred_type)
+            
+            # Validate type-specific fields
+            if cred_type == 'username_password':
+                if not username or not password:
+                    print("Error: --username and --password are required for username_password type", file=sys.stderr)
+                    return 1
+            elif cred_type == 'secret_text':
+                if not secret:
+                    print("Error: --secret is required for secret_text type", file=sys.stderr)
+                    return 1
+            elif cred_type == 'ssh_key':
+                if not username:
+                    print("Error: --username is required for ssh_key type", file=sys.stderr)
+                    return 1
+                if not private_key and not private_key_file:
+                    print("Error: --private-key or --private-key-file is required for ssh_key type", file=sys.stderr)
+                    return 1
+            
+            result = client.create_credential(
+                cred_type=cred_type,
+                cred_id=cred_id,
+                description=description,
+                username=username,
+                password=password,
+                secret=secret,
+                private_key=private_key,
+                private_key_file=private_key_file,
+                passphrase=passphrase,
+                force=force
+            )
+        
+        if result.get('status') == 'success':
+            print(f"✅ {result.get('message', 'Credential created successfully')}")
+        elif result.get('status') == 'exists':
+            print(f"⚠️  {result.get('message', 'Credential already exists')}")
+            print("Use --force to overwrite", file=sys.stderr)
+            return 1
+        else:
+            print(f"❌ Failed to create credential: {result.get('error', 'Unknown error')}")
+            return 1
+        return 0
 
+    elif subcommand == "delete":
+        if len(args) < 2:
+            print("Error: credential ID required", file=sys.stderr)
+            print("Usage: ngen-j cred delete <credential-id> [--force]", file=sys.stderr)
+            return 1
+        
+        cred_id = args[1]
+        force = '--force' in args
+        
+        if not force:
+            response = input(f"Are you sure you want to delete credential '{cred_id}'? (y/N): ").strip().lower()
+            if response not in ['y', 'yes']:
+                print("Credential deletion cancelled.")
+                return 0
+        
+        result = client.delete_credential(cred_id, force=force)
+        
+        if result.get('status') == 'success':
+            print(f"✅ {result.get('message', 'Credential deleted successfully')}")
         else:
-            print(f"Error: Unknown cred subcommand '{subcommand}'", file=sys.stderr)
-            print("Usage: ngen-j cred <list|create|delete> [args...]", file=sys.stderr)
-            sys.exit(1)
-
-    # Handle plugin command
-    if command == "plugin":
-        if len(sys.argv) < 3:
-            print("Error: plugin subcommand required", file=sys.stderr)
-            print("Usage: ngen-j plugin <list|install|uninstall> [args...]", file=sys.stderr)
-            print("\nPlugin list options:", file=sys.stderr)
-            print("  --format <json|csv>  Export format (default: table)", file=sys.stderr)
-            print("  --output <file>      Output file (optional, defaults to stdout)", file=sys.stderr)
-            sys.exit(1)
-
-        subcommand = sys.argv[2]
-        client = JenkinsClient()
-
-        if subcommand == "list":
-            # Parse format option
-            args = sys.argv[3:]
-            output_format = None
-            output_file = None
-
-            if '--format' in args:
-                format_idx = args.index('--format')
-                if format_idx + 1 < len(args):
-                    output_format = args[format_idx + 1].lower()
-                    args = args[:format_idx] + args[format_idx + 2:]
-                else:
-                    print("Error: --format requires a value (json or csv)", file=sys.stderr)
-                    sys.exit(1)
-
-            if '--output' in args or '-o' in args:
-                output_flag = '--output' if '--output' in args else '-o'
-                output_idx = args.index(output_flag)
-                if output_idx + 1 < len(args):
-                    output_file = args[output_idx + 1]
-                    args = args[:output_idx] + args[output_idx + 2:]
-                else:
-                    print("Error: --output requires a filename", file=sys.stderr)
-                    sys.exit(1)
+            print(f"❌ Failed to delete credential: {result.get('error', 'Unknown error')}")
+            return 1
+        return 0
+
+    else:
+        print(f"Error: Unknown cred subcommand '{subcommand}'", file=sys.stderr)
+        print("Usage: ngen-j cred <list|create|delete> [args...]", file=sys.stderr)
+        return 1
+
+
+def _cmd_plugin(args: list) -> int:
+    """Handle plugin command: manage Jenkins plugins."""
+    if not args:
+        print("Error: plugin subcommand required", file=sys.stderr)
+        print("Usage: ngen-j plugin <list|install|uninstall> [args...]", file=sys.stderr)
+        print("\nPlugin list options:", file=sys.stderr)
+        print("  --format <json|csv>  Export format (default: table)", file=sys.stderr)
+        print("  --output <file>      Output file (optional, defaults to stdout)", file=sys.stderr)
+        return 1
+
+    subcommand = args[0]
+    client = _client()
 
-            plugins = client.list_plugins()
+    if subcommand == "list":
+        # Parse format option in one pass
+        opts, leftover = _parse_flags(args[1:], ('--format', '--output', '-o'))
+        if '--format' in leftover:
+            print("Error: --format requires a value (json or csv)", file=sys.stderr)
+            return 1
+        if '--output' in leftover or '-o' in leftover:
+            print("Error: --output requires a filename", file=sys.stderr)
+            return 1
+        output_format = opts['format'].lower() if 'format' in opts else None
+        output_file = opts.get('output') or opts.get('o')
+
+        plugins = client.list_plugins()
+        
+        if output_format == 'json':
+            import json
+            output_data = json.dumps(plugins, indent=2)
+            if output_file:
+                with open(output_file, 'w') as f:
+                    f.write(output_data)
+                print(f"✅ Plugins exported to {output_file} (JSON format)")
+            else:
+                print(output_data)
+            return 0
+        elif output_format == 'csv':
+            import csv
+            if not plugins:
+                print("No plugins found.")
+                return 0
             
-            if output_format == 'json':
-                import json
-                output_data = json.dumps(plugins, indent=2)
-                if output_file:
-                    with open(output_file, 'w') as f:
-                        f.write(output_data)
-                    print(f"✅ Plugins exported to {output_file} (JSON format)")
-                else:
-                    print(output_data)
-                sys.exit(0)
-            elif output_format == 'csv':
-                import csv
-                if not plugins:
-                    print("No plugins found.")
-                    sys.exit(0)
-                
-                # Get all possible fields from plugins
-                fieldnames = ['name', 'version', 'enabled', 'display_name', 'description', 'url']
-                
-                if output_file:
-                    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.DictWriter(f, fieldnames=fieldnames)
-                        writer.writeheader()
-                        for plugin in plugins:
-                            row = {field: plugin.get(field, '') for field in fieldnames}
-                            row['enabled'] = 'Yes' if row.get('enabled', True) else 'No'
-                            writer.writerow(row)
-                    print(f"✅ Plugins exported to {output_file} (CSV format)")
-                else:
-                    writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames)
+            # Get all possible fields from plugins
+            fieldnames = ['name', 'version', 'enabled', 'display_name', 'description', 'url']
+            
+            if output_file:
+                with open(output_file, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames)
                     writer.writeheader()
                     for plugin in plugins:
                         row = {field: plugin.get(field, '') for field in fieldnames}
                         row['enabled'] = 'Yes' if row.get('enabled', True) else 'No'
                         writer.writerow(row)
-                sys.exit(0)
+                print(f"✅ Plugins exported to {output_file} (CSV format)")
             else:
-                # Default table format
-                if plugins:
-                    print("Installed Jenkins Plugins:")
-                    print("=" * 100)
-                    print(f"{'Name':<30} {'Version':<20} {'Enabled':<10} {'Display Name':<40}")
-                    print("=" * 100)
-                    for plugin in plugins:
-                        enabled = "Yes" if plugin.get('enabled', True) else "No"
-                        display_name = plugin.get('display_name', plugin.get('name', 'N/A'))
-                        if len(display_name) > 38:
-                            display_name = display_name[:35] + "..."
-                        print(f"{plugin.get('name', 'N/A'):<30} {plugin.get('version', 'N/A'):<20} {enabled:<10} {display_name:<40}")
-                else:
-                    print("No plugins found.")
-                sys.exit(0)
+                writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames)
+                writer.writeheader()
+                for plugin in plugins:
+                    row = {field: plugin.get(field, '') for field in fieldnames}
+                    row['enabled'] = 'Yes' if row.get('enabled', True) else 'No'
+                    writer.writerow(row)
+            return 0
+        else:
+            # Default table format
+            if plugins:
+                print("Installed Jenkins Plugins:")
+                print("=" * 100)
+                print(f"{'Name':<30} {'Version':<20} {'Enabled':<10} {'Display Name':<40}")
+                print("=" * 100)
+                for plugin in plugins:
+                    enabled = "Yes" if plugin.get('enabled', True) else "No"
+                    display_name = plugin.get('display_name', plugin.get('name', 'N/A'))
+                    if len(display_name) > 38:
+                        display_name = display_name[:35] + "..."
+                    print(f"{plugin.get('name', 'N/A'):<30} {plugin.get('version', 'N/A'):<20} {enabled:<10} {display_name:<40}")
+            else:
+                print("No plugins found.")
+            return 0
 
-        elif subcommand == "install":
-            if len(sys.argv) < 4:
-                print("Error: plugin name(s) required", file=sys.stderr)
-                print("Usage: ngen-j plugin install <plugin1> [plugin2] ...", file=sys.stderr)
-                sys.exit(1)
+    elif subcommand == "install":
+        if len(args) < 2:
+            print("Error: plugin name(s) required", file=sys.stderr)
+            print("Usage: ngen-j plugin install <plugin1> [plugin2] ...", file=sys.stderr)
+            return 1
 
-            plugin_names = sys.argv[3:]
-            result = client.install_plugins(plugin_names, block=False)
+        plugin_names = args[1:]
+        result = client.install_plugins(plugin_names, block=False)
 
-            if result['status'] == 'success':
-                print(f"✅ {result['message']}")
-                print("Note: Plugin installation may take some time. Check Jenkins for installation status.")
-            else:
-                print(f"❌ Failed to install plugins: {result.get('error', 'Unknown error')}")
-                sys.exit(1)
-            sys.exit(0)
-
-        elif subcommand == "uninstall":
-            if len(sys.argv) < 4:
-                print("Error: plugin name(s) required", file=sys.stderr)
-                print("Usage: ngen-j plugin uninstall <plugin1> [plugin2] ...", file=sys.stderr)
-                sys.exit(1)
-
-            plugin_names = sys.argv[3:]
-            result = client.uninstall_plugins(plugin_names)
-
-            if result['status'] == 'success':
-                print(f"✅ {result['message']}")
-                print("Note: Jenkins restart may be required for uninstallation to complete.")
-            else:
-                print(f"❌ Failed to uninstall plugins: {result.get('error', 'Unknown error')}")
-                sys.exit(1)
-            sys.exit(0)
+        if result['status'] == 'success':
+            print(f"✅ {result['message']}")
+            print("Note: Plugin installation may take some time. Check Jenkins for installation status.")
+        else:
+            print(f"❌ Failed to install plugins: {result.get('error', 'Unknown error')}")
+            return 1
+        return 0
 
+    elif subcommand == "uninstall":
+        if len(args) < 2:
+            print("Error: plugin name(s) required", file=sys.stderr)
+            print("Usage: ngen-j plugin uninstall <plugin1> [plugin2] ...", file=sys.stderr)
+            return 1
+
+        plugin_names = args[1:]
+        result = client.uninstall_plugins(plugin_names)
+
+        if result['status'] == 'success':
+            print(f"✅ {result['message']}")
+            print("Note: Jenkins restart may be required for uninstallation to complete.")
         else:
-            print(f"Error: Unknown plugin subcommand '{subcommand}'", file=sys.stderr)
-            print("Usage: ngen-j plugin <list|install|uninstall> [args...]", file=sys.stderr)
-            sys.exit(1)
+            print(f"❌ Failed to uninstall plugins: {result.get('error', 'Unknown error')}")
+            return 1
+        return 0
+
+    else:
+        print(f"Error: Unknown plugin subcommand '{subcommand}'", file=sys.stderr)
+        print("Usage: ngen-j plugin <list|install|uninstall> [args...]", file=sys.stderr)
+        return 1
+
+
+# Built-in command dispatch table: O(1) lookup instead of an if-chain,
+# and a single source of truth for which commands are built in.
+BUILTIN = {
+    "login": handle_login_command,
+    "check": handle_check_command,
+    "jobs": _cmd_jobs,
+    "job": _cmd_job,
+    "build": _cmd_build,
+    "create": _cmd_create,
+    "delete": _cmd_delete,
+    "get-xml": _cmd_get_xml,
+    "log": _cmd_log,
+    "cred": _cmd_cred,
+    "plugin": _cmd_plugin,
+}
+
+# All built-in command names, precomputed once for O(1) membership checks.
+BUILTINS = frozenset(BUILTIN)
+
+
+def main():
+    """Main entry point for ngen-j command."""
+    # Parse argv exactly once; everything below works on these locals
+    # instead of re-indexing and re-slicing per branch
+    argv = sys.argv
+    command = argv[1] if len(argv) >= 2 else None
+    rest = argv[2:]
+
+    # Handle version flag first: nothing else (no imports beyond the
+    # package init, no filesystem work) happens on this path
+    if command in ("--version", "-V"):
+        from . import __version__
+        print(f"ngen-j version {__version__}")
+        sys.exit(0)
+
+    # No-args and help flags share the single precompiled usage text
+    if command is None or command in ("-h", "--help", "help"):
+        sys.stderr.write(_USAGE)
+        sys.exit(0)
+
+    # Dispatch built-in commands through the table
+    handler = BUILTIN.get(command)
+    if handler is not None:
+        sys.exit(handler(rest))
 
     # Try to find and execute script
-    args = sys.argv[2:]
-    script_path = find_script(command)
-    
-    if script_path is not None:
-        exit_code = execute_script(script_path, args)
-        sys.exit(exit_code)
+    entry = _script_index().get(command)
+
+    if entry is not None:
+        script_path, mode = entry
+        if mode & 0o111 == 0:
+            # Installed without exec bits (e.g. unpacked from a wheel
+            # that dropped them): fix up once, using the mode already
+            # cached by the directory scan instead of an os.access call
+            try:
+                os.chmod(script_path, mode | 0o755)
+            except OSError as e:
+                # e.g. root-owned site-packages, unprivileged user:
+                # warn and still attempt the exec, which reports the
+                # real failure cleanly if the bit genuinely matters
+                print(f"Warning: could not make {script_path} executable: {e}", file=sys.stderr)
+        # Does not return on POSIX: the process image is replaced
+        sys.exit(execute_script(script_path, rest))
     
-    # Command not found
-    print(f"Error: command '{command}' not found", file=sys.stderr)
-    print(f"Expected bundled script: ngen-j-{command}", file=sys.stderr)
+    # Command not found: list what is available, derived from the
+    # dispatch table and the script index so the list never drifts
+    available = sorted(BUILTINS | _script_index().keys())
+    sys.stderr.write(
+        f"Error: command '{command}' not found\n"
+        f"Expected bundled script: ngen-j-{command}\n"
+        "Available commands: " + ", ".join(available) + "\n"
+    )
     sys.exit(1)
 
 
@@ -2,9 +2,23 @@
 
 import os
 import sys
+import functools
 from typing import Optional, Dict, Any
 from api4jenkins import Jenkins
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON bytes with orjson when available (~3-5x faster than stdlib)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
 
 def get_env_file_path() -> str:
     """Get the path to the .env file."""
@@ -13,24 +27,42 @@ def get_env_file_path() -> str:
     return os.path.join(ngen_j_dir, ".env")
 
 
+@functools.lru_cache(maxsize=1)
+def _parse_env_file(env_file: str, mtime_ns: int) -> dict:
+    """
+    Parse the .env file, cached per (path, mtime) for the process
+    lifetime so edits on disk invalidate the cache.
+    """
+    env_vars = {}
+    try:
+        with open(env_file, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    if '=' in line:
+                        key, value = line.split('=', 1)
+                        env_vars[key.strip()] = value.strip()
+    except Exception as e:
+        print(f"Warning: Could not read .env file: {e}", file=sys.stderr)
+
+    return env_vars
+
+
 def load_env_file() -> dict:
     """Load environment variables from ~/.ngen-j/.env file."""
     env_file = get_env_file_path()
-    env_vars = {}
 
-    if os.path.exists(env_file):
-        try:
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        if '=' in line:
-                            key, value = line.split('=', 1)
-                            env_vars[key.strip()] = value.strip()
-        except Exception as e:
-            print(f"Warning: Could not read .env file: {e}", file=sys.stderr)
+    try:
+        mtime_ns = os.stat(env_file).st_mtime_ns
+    except OSError:
+        return {}
+
+    return _parse_env_file(env_file, mtime_ns)
 
-    return env_vars
+
+def clear_env_cache() -> None:
+    """Drop the cached .env parse so the next load re-reads the file."""
+    _parse_env_file.cache_clear()
 
 
 def save_env_file(env_vars: dict) -> bool:
@@ -101,16 +133,13 @@ class JenkinsClient:
             sys.exit(1)
     
     def list_jobs(self) -> list:
-        """List all Jenkins jobs."""
+        """List all Jenkins jobs (name and URL only)."""
         try:
-            jobs = []
-            # Use the correct API method for api4jenkins
-            for job in self.client.iter():
-                jobs.append({
-                    'name': job.name,
-                    'url': job.url
-                })
-            return jobs
+            # Ask the server for just the fields we use; the default
+            # payload includes builds, health reports etc. per job
+            info = self.client.api_json(tree='jobs[name,url]')
+            return [{'name': job['name'], 'url': job['url']}
+                    for job in info.get('jobs', [])]
         except Exception as e:
             print(f"Error listing jobs: {e}", file=sys.stderr)
             sys.exit(1)
@@ -122,12 +151,17 @@ class JenkinsClient:
             if job is None:
                 raise KeyError(f"Job '{job_name}' not found")
 
-            # Get basic job info
+            # Get basic job info with a tree filter so the server only
+            # serializes the fields we print
+            try:
+                data = job.api_json(tree='name,url,description,buildable')
+            except Exception:
+                data = {}
             job_info = {
-                'name': getattr(job, 'name', job_name),
-                'url': getattr(job, 'url', f"{self.url}/job/{job_name}/"),
-                'description': getattr(job, 'description', ''),
-                'buildable': getattr(job, 'buildable', False),
+                'name': data.get('name', job_name),
+                'url': data.get('url', f"{self.url}/job/{job_name}/"),
+                'description': data.get('description', ''),
+                'buildable': data.get('buildable', False),
             }
 
             # Get recent builds (up to 3, starting from most recent)
@@ -194,11 +228,11 @@ class JenkinsClient:
             # Use direct API call to get jobs with build information
             import httpx
             # Try to get jobs without tree specification first to avoid server errors
-            api_url = f"{self.url}/api/json?tree=jobs[name,url,lastBuild[number,result,timestamp,duration],lastCompletedBuild[number,result,timestamp,duration]]"
+            api_url = f"{self.url}/api/json?tree=jobs[name,url,description,buildable,lastBuild[number,result,timestamp,duration],lastCompletedBuild[number,result,timestamp,duration]]"
 
             response = httpx.get(api_url, auth=self.client._auth)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
 
             all_jobs_data = data.get('jobs', [])
 
@@ -225,8 +259,8 @@ class JenkinsClient:
                             job_info = {
                                 'name': job_name,
                                 'url': job_data.get('url', f"{self.url}/job/{job_name}/"),
-                                'description': '',  # Not available in this API call
-                                'buildable': True,  # Assume buildable
+                                'description': job_data.get('description') or '',
+                                'buildable': job_data.get('buildable', True),
                                 'last_build': {
                                     'number': getattr(last_build, 'number', 'N/A') if last_build else 'N/A',
                                     'status': status.upper(),
@@ -446,6 +480,26 @@ class JenkinsClient:
             print(f"Error getting build logs: {e}", file=sys.stderr)
             sys.exit(1)
 
+    def stream_build_logs(self, job_name: str, build_number: int):
+        """Stream console output from a build as raw byte chunks.
+
+        Yields ~64KB chunks straight from the consoleText endpoint, so
+        memory stays bounded no matter how large the log is and output
+        can start before the download finishes.
+        """
+        console_url = f"{self.url}/job/{job_name}/{build_number}/consoleText"
+        import httpx
+        try:
+            with httpx.stream("GET", console_url, auth=self.client._auth) as response:
+                if response.status_code == 404:
+                    print(f"Error: Build {build_number} not found for job '{job_name}'", file=sys.stderr)
+                    sys.exit(1)
+                response.raise_for_status()
+                yield from response.iter_bytes(65536)
+        except Exception as e:
+            print(f"Error getting build logs: {e}", file=sys.stderr)
+            sys.exit(1)
+
     def delete_job(self, job_name: str, force: bool = False) -> dict:
         """Delete a Jenkins job."""
         import httpx
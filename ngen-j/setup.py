@@ -1,15 +1,43 @@
 """Setup configuration for ngen-j package."""
 
 from setuptools import setup, find_packages
+from setuptools.command.install import install
 from pathlib import Path
+import stat
 
 # Read README for long description
 readme_file = Path(__file__).parent / "README.md"
 long_description = readme_file.read_text() if readme_file.exists() else ""
 
 
+class PostInstallCommand(install):
+    """Post-installation for installation mode."""
+
+    def run(self):
+        """Run post-installation tasks."""
+        install.run(self)
+        # Bundled scripts are executed directly at dispatch time, so set
+        # their exec bit once here instead of checking/fixing it on
+        # every invocation.
+        if self.install_lib:
+            scripts_dir = Path(self.install_lib) / "ngen_j" / "scripts"
+        else:
+            scripts_dir = Path(__file__).parent / "ngen_j" / "scripts"
+
+        if scripts_dir.exists():
+            for script_file in scripts_dir.glob("ngen-j-*"):
+                if script_file.is_file():
+                    try:
+                        script_file.chmod(stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
+                    except Exception as e:
+                        print(f"Warning: Could not make {script_file} executable: {e}")
+
+
 setup(
     packages=["ngen_j"],
     package_dir={"ngen_j": "ngen_j"},
+    cmdclass={
+        "install": PostInstallCommand,
+    },
 )
 